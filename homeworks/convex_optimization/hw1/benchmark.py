@@ -0,0 +1,29 @@
+from utils.benchmark_utils import *
+
+
+def main():
+    # Min cost flow against the integer model, up to thousands of factories, distribution centers and stores
+    results = benchmark_min_shipping_cost([(20, 5, 40), (60, 15, 120), (150, 40, 250), (1000, 200, 2000), (3000, 500, 5000)])
+    print_results(results)
+
+    # Instance construction with one draw for all routes, up to 10^5 routes
+    results = benchmark_instance_generation([(100, 20, 200), (1000, 200, 2000), (10**4, 10**3, 10**4)])
+    print_results(results)
+
+    # Propagation engine against the rebuilt and the persistent MIP on puzzle files
+    results = benchmark_sudoku([1000, 10**4])
+    print_results(results)
+
+    # Propagation engine on n^2 by n^2 boards
+    results = benchmark_sudoku_sizes([3, 4, 5])
+    print_results(results)
+
+    # Puzzles with unique solutions, fewer givens make harder puzzles
+    results = benchmark_sudoku_generator(1000, [35, 28, 17])
+    print_results(results)
+    results = benchmark_sudoku_generator(100, [180, 140, 110], box=4)
+    print_results(results)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,78 @@
+import gurobipy as gp
+from gurobipy import GRB
+import numpy as np
+import math
+import time
+
+
+class SudokuModel:
+    """
+    Sudoku MIP built once for a board shape and re-solved for new puzzles
+    Givens are lower bounds of the binary variables, so a new puzzle is one bulk bound update on the MVar
+    """
+    def __init__(self, size=9, B=None):
+        start_time = time.perf_counter()
+        self.size = size
+        box = math.isqrt(size)
+        if B is None:
+            B = {
+                k: [((k // box) * box + di, (k % box) * box + dj) for di in range(box) for dj in range(box)]
+                for k in range(size)
+            }
+
+        # Create model
+        self.model = gp.Model(name="sudoku")
+        self.model.setParam('OutputFlag', 0)
+
+        # Set variables, x[i, j, n] is 1 when cell (i, j) holds number n + 1
+        self.x = self.model.addMVar((size, size, size), vtype=GRB.BINARY, name='x')
+
+        # Define objective function
+        self.model.setObjective(0, GRB.MINIMIZE)
+
+        # Add constraints, one number per cell and each number once per column, row and block
+        self.model.addConstr(self.x.sum(axis=2) == 1, name='c1')
+        self.model.addConstr(self.x.sum(axis=0) <= 1, name='c2')
+        self.model.addConstr(self.x.sum(axis=1) <= 1, name='c3')
+        for k in B:
+            self.model.addConstr(gp.quicksum(self.x[i, j, :] for i, j in B[k]) <= 1, name=f'c4[{k}]')
+        self.model.update()
+
+        self.build_time = time.perf_counter() - start_time
+        self.solve_time = None
+
+
+    def solve(self, grid):
+        """
+        Reset the lower bounds from the givens of a row by row grid with 0 for empty cells,
+        return the solved grid, None when the puzzle has no solution
+        """
+        start_time = time.perf_counter()
+        grid = np.asarray(grid).reshape(self.size, self.size)
+
+        # One hot lower bounds of the given cells
+        lb = np.zeros((self.size, self.size, self.size))
+        i, j = np.nonzero(grid)
+        lb[i, j, grid[i, j] - 1] = 1
+        self.x.setAttr('LB', lb)
+
+        self.model.optimize()
+        self.solve_time = time.perf_counter() - start_time
+
+        if self.model.SolCount == 0: return None
+
+        return (self.x.X.argmax(axis=2) + 1).ravel().tolist()
+
+
+    def solve_batch(self, puzzles):
+        """
+        Return array of solved grids of an array of puzzles, rows of zeros for puzzles without solutions
+        """
+        puzzles = np.asarray(puzzles).reshape(-1, self.size * self.size)
+        solutions = np.zeros_like(puzzles)
+        for k, grid in enumerate(puzzles):
+            solution = self.solve(grid)
+            if solution is not None:
+                solutions[k] = solution
+
+        return solutions
\ No newline at end of file
@@ -0,0 +1,172 @@
+from utils.instance_utils import *
+from utils.solve_utils import *
+from utils.sudoku_utils import *
+from classes.SudokuModel import *
+import numpy as np
+import tempfile
+import random
+import time
+import os
+
+
+def benchmark_min_shipping_cost(sizes, degree=5, lp_limit=2000, analytic=True, seed=0):
+    """
+    Return timings of the min cost flow against the integer model on random transshipment networks
+    Sampled costs are all distinct, then successive shortest paths needs one Dijkstra per augmenting path
+    """
+    results = []
+    for num_factories, num_dcs, num_stores in sizes:
+        instance = get_transshipment_instance(num_factories, num_dcs, num_stores, degree=degree, seed=seed, analytic=analytic)
+        row = {"factories": num_factories, "dcs": num_dcs, "stores": num_stores, "routes": len(instance[0])}
+
+        start_time = time.perf_counter()
+        row["flow_value"] = solve_min_shipping_cost_flow(instance)["objval"]
+        row["flow_time"] = time.perf_counter() - start_time
+
+        # The integer model is only solved on the smaller networks
+        if len(instance[0]) <= lp_limit:
+            start_time = time.perf_counter()
+            row["mip_value"] = solve_min_shipping_cost(instance)["objval"]
+            row["mip_time"] = time.perf_counter() - start_time
+
+        row["match"] = abs(row.get("mip_value", row["flow_value"]) - row["flow_value"]) < 1e-6
+        results.append(row)
+
+    return results
+
+
+def benchmark_instance_generation(sizes, degree=5, per_arc_limit=10**4, seed=0):
+    """
+    Return timings of the array instance builder with analytic and sampled expectations against the former loop
+    of random.uniform calls per value
+    """
+    results = []
+    for num_factories, num_dcs, num_stores in sizes:
+        row = {"factories": num_factories, "dcs": num_dcs, "stores": num_stores}
+
+        start_time = time.perf_counter()
+        instance = get_transshipment_arrays(num_factories, num_dcs, num_stores, degree=degree, seed=seed, analytic=True)
+        row["analytic_time"] = time.perf_counter() - start_time
+        row["routes"] = len(instance[3])
+
+        start_time = time.perf_counter()
+        get_transshipment_arrays(num_factories, num_dcs, num_stores, degree=degree, seed=seed)
+        row["sampled_time"] = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        get_transshipment_instance(num_factories, num_dcs, num_stores, degree=degree, seed=seed, analytic=True)
+        row["named_time"] = time.perf_counter() - start_time
+
+        # Expectations estimated one value at a time by the former loop, only on the smaller networks
+        if 2 * row["routes"] <= per_arc_limit:
+            start_time = time.perf_counter()
+            [_loop_uniform_expectation(val) for val in np.concatenate([instance[5], instance[6]]).tolist()]
+            row["loop_time"] = time.perf_counter() - start_time
+
+        results.append(row)
+
+    return results
+
+
+def benchmark_sudoku(counts, mip_limit=50, processes=None, seed=0):
+    """
+    Return puzzles per second of the propagation engine, serial and over a process pool, against the MIP rebuilt per puzzle
+    and the persistent MIP
+    Puzzles are random symmetries of the hard-coded puzzle, read back from a one line per puzzle file
+    """
+    rng = random.Random(seed)
+    grid = get_sudoku_grid(get_sudoku_instance())
+    results = []
+    for count in counts:
+        puzzles = [shuffle_sudoku(grid, rng) for _ in range(count)]
+        row = {"size": 9, "puzzles": count}
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "puzzles.txt")
+            write_sudoku_file(path, puzzles)
+
+            start_time = time.perf_counter()
+            solutions = solve_sudoku_file(path, processes=1)
+            row["serial_rate"] = count / (time.perf_counter() - start_time)
+
+            start_time = time.perf_counter()
+            row["match"] = solve_sudoku_file(path, os.path.join(folder, "solutions.txt"), processes) == solutions
+            row["pool_rate"] = count / (time.perf_counter() - start_time)
+
+        # The MIP only solves a sample of the puzzles
+        sample = puzzles[:mip_limit]
+        start_time = time.perf_counter()
+        mip = [solve_sudoku(get_sudoku_instance_from_grid(puzzle))["x"] for puzzle in sample]
+        row["mip_rate"] = len(sample) / (time.perf_counter() - start_time)
+        row["match"] &= all(x[i // 9, i % 9] == v for x, s in zip(mip, solutions) for i, v in enumerate(s))
+
+        # The persistent MIP only updates the bounds of the givens
+        model = SudokuModel()
+        start_time = time.perf_counter()
+        template = model.solve_batch(sample)
+        row["template_rate"] = len(sample) / (time.perf_counter() - start_time)
+        row["match"] &= bool((template == np.array(solutions[:len(sample)])).all())
+
+        results.append(row)
+
+    return results
+
+
+def benchmark_sudoku_sizes(boxes, count=20, ratio=0.6, seed=0):
+    """
+    Return puzzles per second of the propagation engine on larger boards, keeping a ratio of the givens of a full grid
+    """
+    rng = random.Random(seed)
+    results = []
+    for box in boxes:
+        size = box * box
+        full = [(box * (r % box) + r // box + c) % size + 1 for r in range(size) for c in range(size)]
+        puzzles = [[v if rng.random() < ratio else 0 for v in shuffle_sudoku(full, rng)] for _ in range(count)]
+
+        start_time = time.perf_counter()
+        solutions = solve_sudoku_batch(puzzles, processes=1)
+        row = {"size": size, "puzzles": count, "serial_rate": count / (time.perf_counter() - start_time)}
+        row["match"] = all(s is not None and all(p in (0, v) for p, v in zip(puzzle, s)) for puzzle, s in zip(puzzles, solutions))
+
+        results.append(row)
+
+    return results
+
+
+def benchmark_sudoku_generator(count, min_givens_list, box=3, processes=None, seed=0):
+    """
+    Return puzzles per minute of the generator for every target number of givens, with a uniqueness recheck
+    """
+    results = []
+    for min_givens in min_givens_list:
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "puzzles.txt")
+
+            start_time = time.perf_counter()
+            generate_sudoku_file(path, count, box, min_givens, seed, processes)
+            row = {"size": box * box, "min_givens": min_givens, "puzzles": count}
+            row["rate_per_min"] = 60 * count / (time.perf_counter() - start_time)
+            puzzles = read_sudoku_file(path)
+
+        row["avg_givens"] = sum(sum(1 for v in puzzle if v) for puzzle in puzzles) / count
+        row["unique"] = all(count_sudoku_solutions(puzzle) == 1 for puzzle in puzzles)
+        results.append(row)
+
+    return results
+
+
+def _loop_uniform_expectation(val, n_samples=1000, variation=0.01):
+    """
+    Return expected value of a uniform random variable with the former pure Python loop, kept as baseline
+    """
+    return sum(val * (1 + random.uniform(-variation, variation)) for _ in range(n_samples)) / n_samples
+
+
+def print_results(results):
+    """
+    Print benchmark result rows as a table
+    """
+    keys = list(dict.fromkeys(k for row in results for k in row))
+    print(" ".join(f"{k:>12}" for k in keys))
+    for row in results:
+        print(" ".join(f"{row[k]:>12.6g}" if isinstance(row.get(k), float) else f"{str(row.get(k, '-')):>12}" for k in keys))
\ No newline at end of file
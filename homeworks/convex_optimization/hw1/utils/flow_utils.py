@@ -0,0 +1,151 @@
+from scipy.sparse.csgraph import dijkstra
+import scipy.sparse as sp
+import numpy as np
+
+
+def min_cost_flow(n, u, v, cap, cost, s, t, demand, tol=1e-9):
+    """
+    Return flow value, total cost and arc flows of a minimum cost flow of up to demand units from s to t
+    Primal-dual successive shortest paths: every Dijkstra on reduced costs is followed by blocking flows
+    on the zero reduced cost arcs, so there is one shortest path computation per distinct path cost
+    """
+    start, tail, head, res, rcost, rev, forward = _residual_csr(n, u, v, cap, cost)
+    potential = np.zeros(n)
+    value = 0
+
+    # Python lists are much faster than numpy arrays for scalar access in the search loop
+    head_list, rev_list, end = head.tolist(), rev.tolist(), start[1:].tolist()
+    res_list = res.tolist()
+
+    while value < demand:
+        # Shortest distances on the reduced costs of the arcs with residual capacity
+        res = np.array(res_list)
+        open_arcs = np.flatnonzero(res > tol)
+        reduced = np.maximum(rcost[open_arcs] + potential[tail[open_arcs]] - potential[head[open_arcs]], 0)
+        dist = _shortest_distances(n, tail[open_arcs], head[open_arcs], reduced, s)
+        if not np.isfinite(dist[t]): break
+
+        # Keep the reduced costs of all residual arcs non-negative
+        potential += np.minimum(dist, dist[t])
+
+        # Admissible arcs have zero reduced cost, blocking flows on them only use shortest paths
+        reduced = rcost[open_arcs] + potential[tail[open_arcs]] - potential[head[open_arcs]]
+        admissible = np.zeros(len(res), dtype=bool)
+        admissible[open_arcs[np.abs(reduced) <= tol]] = True
+
+        pushed = value
+        while value < demand:
+            level = _bfs_levels(n, start, head, admissible & (np.array(res_list) > tol), s, t)
+            if level[t] < 0: break
+
+            allowed = (admissible & (level[tail] >= 0)).tolist()
+            value += _blocking_flow(start.tolist(), end, head_list, rev_list, res_list, allowed, level.tolist(), s, t, demand - value, tol)
+
+        # Round-off can leave the shortest path without admissible arcs
+        if value == pushed: break
+
+    flow = cap - np.array(res_list)[forward]
+
+    return value, float(flow @ cost), flow
+
+
+def _residual_csr(n, u, v, cap, cost):
+    """
+    Return residual graph in CSR order with reverse arcs of negated cost
+    """
+    m = len(u)
+    tail = np.concatenate([u, v])
+    order = np.argsort(tail, kind='stable')
+
+    # Position of every original forward and backward arc after sorting
+    position = np.empty(2 * m, dtype=np.int64)
+    position[order] = np.arange(2 * m)
+
+    start = np.zeros(n + 1, dtype=np.int64)
+    start[1:] = np.cumsum(np.bincount(tail, minlength=n))
+    res = np.concatenate([cap, np.zeros(m)])[order].astype(float)
+    rcost = np.concatenate([cost, -cost])[order].astype(float)
+
+    return start, tail[order], np.concatenate([v, u])[order], res, rcost, position[(order + m) % (2 * m)], position[:m]
+
+
+def _shortest_distances(n, a, b, w, s):
+    """
+    Return Dijkstra distances from s, parallel arcs are reduced to the cheapest one
+    """
+    keys = a * n + b
+    order = np.lexsort((w, keys))
+    first = order[np.r_[True, keys[order][1:] != keys[order][:-1]]] if len(order) else order
+
+    # Explicit zeros are kept as zero weight arcs
+    A = sp.csr_matrix((w[first], (a[first], b[first])), shape=(n, n))
+
+    return dijkstra(A, indices=s)
+
+
+def _bfs_levels(n, start, head, mask, s, t):
+    """
+    Return BFS levels from s over the masked arcs, up to the level of t
+    """
+    level = np.full(n, -1, dtype=np.int64)
+    level[s] = 0
+    frontier = np.array([s])
+    depth = 0
+
+    while len(frontier) and level[t] < 0:
+        depth += 1
+
+        # All arcs leaving the frontier
+        counts = start[frontier + 1] - start[frontier]
+        arcs = np.repeat(start[frontier] - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+
+        nxt = head[arcs[mask[arcs]]]
+        nxt = np.sort(nxt[level[nxt] < 0])
+        nxt = nxt[np.r_[True, nxt[1:] != nxt[:-1]]] if len(nxt) else nxt
+        level[nxt] = depth
+        frontier = nxt
+
+    return level
+
+
+def _blocking_flow(it, end, head, rev, res, allowed, level, s, t, limit, tol):
+    """
+    Return flow pushed along level increasing allowed arcs with current arc pointers, at most limit units
+    """
+    total = 0
+    path = []
+    x = s
+
+    while total < limit:
+        if x == t:
+            # Augment by the bottleneck and restart from the tail of the first saturated arc
+            bottleneck = min(min(res[a] for a in path), limit - total)
+            for a in path:
+                res[a] -= bottleneck
+                res[rev[a]] += bottleneck
+            total += bottleneck
+
+            k = next((i for i, a in enumerate(path) if res[a] <= tol), len(path))
+            del path[k:]
+            x = head[path[-1]] if path else s
+            continue
+
+        # Advance along the current arc
+        a = it[x]
+        while a < end[x] and (not allowed[a] or res[a] <= tol or level[head[a]] != level[x] + 1):
+            a += 1
+        it[x] = a
+
+        if a < end[x]:
+            path.append(a)
+            x = head[a]
+            continue
+
+        # Retreat from a dead end
+        if x == s: break
+        level[x] = -1
+        a = path.pop()
+        x = head[rev[a]]
+        it[x] += 1
+
+    return total
\ No newline at end of file
@@ -1,5 +1,8 @@
+from utils.sudoku_utils import *
 from itertools import product
+import numpy as np
 import random
+import math
 
 
 def get_max_balance_instance():
@@ -18,7 +21,7 @@ def get_max_balance_instance():
     return T, I, r
 
 
-def get_min_shipping_cost_instance():
+def get_min_shipping_cost_instance(seed=None, analytic=False):
     """
     Returns instance for the min shipping cost problem
     """
@@ -35,32 +38,15 @@ def get_min_shipping_cost_instance():
     E = [(f, d) for f in F for d in D] + [(d, s) for d in D for s in S]
 
     # Costs
-    c_exp = {
-        ("f1", "d1"): uniform_expectation(2),
-        ("f1", "d2"): uniform_expectation(4),
-        ("f2", "d1"): uniform_expectation(3),
-        ("f2", "d2"): uniform_expectation(1),
-        ("d1", "s1"): uniform_expectation(3),
-        ("d1", "s2"): uniform_expectation(1),
-        ("d1", "s3"): uniform_expectation(2),
-        ("d2", "s1"): uniform_expectation(2),
-        ("d2", "s2"): uniform_expectation(3),
-        ("d2", "s3"): uniform_expectation(2)
-    }
+    c = [2, 4, 3, 1, 3, 1, 2, 2, 3, 2]
 
     # Capacities
-    mu_exp = {
-        ("f1", "d1"): uniform_expectation(60),
-        ("f1", "d2"): uniform_expectation(50),
-        ("f2", "d1"): uniform_expectation(40),
-        ("f2", "d2"): uniform_expectation(60),
-        ("d1", "s1"): uniform_expectation(40),
-        ("d1", "s2"): uniform_expectation(40),
-        ("d1", "s3"): uniform_expectation(40),
-        ("d2", "s1"): uniform_expectation(40),
-        ("d2", "s2"): uniform_expectation(40),
-        ("d2", "s3"): uniform_expectation(40)
-    }
+    mu = [60, 50, 40, 60, 40, 40, 40, 40, 40, 40]
+
+    # Expected costs and capacities in one draw
+    expectations = uniform_expectations(c + mu, seed=seed, analytic=analytic).tolist()
+    c_exp = dict(zip(E, expectations[:len(E)]))
+    mu_exp = dict(zip(E, expectations[len(E):]))
 
     # Supply capacity at factories
     su = {"f1": 70, "f2": 50}
@@ -71,6 +57,118 @@ def get_min_shipping_cost_instance():
     return E, F, S, D, c_exp, mu_exp, su, de
 
 
+def get_transshipment_instance(num_factories, num_dcs, num_stores, degree=5, seed=None, analytic=False):
+    """
+    Returns random instance for the min shipping cost problem with named nodes and tuple keyed routes
+    """
+    nf, nd, ns, u, v, c_exp, mu_exp, su, de = get_transshipment_arrays(num_factories, num_dcs, num_stores, degree, seed, analytic)
+
+    # Node names in the order of the array indices
+    F = [f"f{k + 1}" for k in range(nf)]
+    D = [f"d{k + 1}" for k in range(nd)]
+    S = [f"s{k + 1}" for k in range(ns)]
+    nodes = F + D + S
+    E = [(nodes[i], nodes[j]) for i, j in zip(u.tolist(), v.tolist())]
+
+    return E, F, S, D, dict(zip(E, c_exp.tolist())), dict(zip(E, mu_exp.tolist())), dict(zip(F, su.tolist())), dict(zip(S, de.tolist()))
+
+
+def get_transshipment_arrays(num_factories, num_dcs, num_stores, degree=5, seed=None, analytic=False):
+    """
+    Returns random feasible instance for the min shipping cost problem as arrays
+    Nodes are numbered factories first, then distribution centers, then stores,
+    every factory ships to degree distribution centers and every store is served by degree distribution centers
+    Only analytic=True builds a 10^5 route instance in milliseconds, sampling 1000 draws per value takes seconds
+    """
+    rng = np.random.default_rng(seed)
+    degree = min(degree, num_dcs)
+    nf, nd, ns = num_factories, num_dcs, num_stores
+
+    # Routes to distinct random distribution centers
+    fd = _sample_without_replacement(rng, nd, nf, degree)
+    ds = _sample_without_replacement(rng, nd, ns, degree)
+    u = np.concatenate([np.repeat(np.arange(nf), degree), nf + ds.ravel()])
+    v = np.concatenate([nf + fd.ravel(), nf + nd + np.repeat(np.arange(ns), degree)])
+
+    # Distribution center k without inbound route is reached from factory k % nf
+    unreached = np.setdiff1d(np.arange(nd), fd.ravel())
+    u = np.concatenate([u, unreached % nf])
+    v = np.concatenate([v, nf + unreached])
+
+    # Expected costs and capacities around integer nominal values
+    c = rng.integers(1, 11, size=len(u))
+    mu = rng.integers(20, 61, size=len(u))
+    expectations = uniform_expectations(np.concatenate([c, mu]), seed=rng, analytic=analytic)
+    c_exp, mu_exp = expectations[:len(u)], expectations[len(u):]
+
+    # Demand at stores and supply at factories with some slack
+    de = rng.integers(10, 31, size=ns)
+    su = np.full(nf, int(np.ceil(1.5 * de.sum() / nf)))
+
+    # Feasible plan: every store is served by its first route, every distribution center by its first inbound route
+    store_route = nf * degree + np.arange(ns) * degree
+    dc = v[:nf * degree] - nf
+    dc_route = np.full(nd, -1)
+    dc_route[dc[::-1]] = np.arange(nf * degree)[::-1]
+    dc_route[unreached] = len(u) - len(unreached) + np.arange(len(unreached))
+
+    # Raise the capacities and supplies on the plan to its loads
+    load = np.bincount(u[store_route] - nf, weights=de, minlength=nd)
+    mu_exp[store_route] = np.maximum(mu_exp[store_route], de)
+    mu_exp[dc_route] = np.maximum(mu_exp[dc_route], load)
+    su = np.maximum(su, np.ceil(np.bincount(u[dc_route], weights=load, minlength=nf))).astype(np.int64)
+
+    return nf, nd, ns, u, v, c_exp, mu_exp, su, de
+
+
+def get_sudoku_instance_from_grid(grid):
+    """
+    Returns sudoku instance of a row by row grid with 0 for empty cells
+    """
+    size = math.isqrt(len(grid))
+    box = math.isqrt(size)
+
+    # Set of rows, columns, blocks or numbers
+    N = range(size)
+
+    # Sets of cells in sub blocks
+    B = {
+        k: [((k // box) * box + di, (k % box) * box + dj) for di in range(box) for dj in range(box)]
+        for k in N
+    }
+
+    a = {
+        (i, j, n): int(grid[i * size + j] == n + 1)
+        for i, j, n in product(N, N, N)
+    }
+
+    return N, B, a
+
+
+def get_random_sudoku_instance(min_givens=24, seed=None):
+    """
+    Returns random sudoku instance with a unique solution
+    """
+    puzzle, _ = generate_sudoku(random.Random(seed), min_givens=min_givens)
+
+    return get_sudoku_instance_from_grid(puzzle)
+
+
+def _sample_without_replacement(rng, n, rows, k):
+    """
+    Returns k distinct values below n for every row
+    """
+    picks = np.empty((rows, 0), dtype=np.int64)
+    for j in range(k):
+        # Rank among the values not picked yet, shifted past the smaller picks
+        r = rng.integers(0, n - j, size=rows)
+        for col in np.sort(picks, axis=1).T:
+            r += col <= r
+        picks = np.column_stack([picks, r])
+
+    return picks
+
+
 def get_sudoku_instance():
     """
     Returns instance for the sudoku problem
@@ -106,8 +204,26 @@ def get_sudoku_instance():
     return N, B, a
 
 
-def uniform_expectation(val, n_samples=1000, variation=0.01):
+def uniform_expectation(val, n_samples=1000, variation=0.01, seed=None):
     """
     Returns expected value of a random variable with uniform distribution
     """
-    return sum(val * (1 + random.uniform(-variation, variation)) for _ in range(n_samples)) / n_samples
\ No newline at end of file
+    return float(uniform_expectations([val], n_samples, variation, seed)[0])
+
+
+def uniform_expectations(vals, n_samples=1000, variation=0.01, seed=None, analytic=False):
+    """
+    Returns sample means of uniform random variables around every value, or their exact means
+    """
+    vals = np.asarray(vals, dtype=float)
+    if analytic: return vals.copy()
+
+    rng = np.random.default_rng(seed)
+    means = np.empty(len(vals))
+
+    # Draw rows in blocks to bound the memory of the sample matrix
+    block = max(1, 10**6 // n_samples)
+    for lo in range(0, len(vals), block):
+        means[lo:lo + block] = rng.uniform(-variation, variation, size=(len(vals[lo:lo + block]), n_samples)).mean(axis=1)
+
+    return vals * (1 + means)
\ No newline at end of file
@@ -1,4 +1,6 @@
+from utils.flow_utils import *
 from itertools import product
+import numpy as np
 import gurobipy as gp
 from gurobipy import GRB
 
@@ -62,12 +64,9 @@ def solve_min_shipping_cost(instance):
     # Add constraints
     for e in E:
         x[e].ub = mu_exp[e]
-    model.addConstrs((
-        gp.quicksum(x[f, d] for f in F) - gp.quicksum(x[d, s] for s in S) == 0
-        for d in D), name="c1"
-    )
-    model.addConstrs((gp.quicksum(x[f, d] for d in D) <= su[f]for f in F), name="c2")
-    model.addConstrs((gp.quicksum(x[d, s] for d in D) >= de[s]for s in S), name="c3")
+    model.addConstrs((x.sum("*", d) - x.sum(d, "*") == 0 for d in D), name="c1")
+    model.addConstrs((x.sum(f, "*") <= su[f] for f in F), name="c2")
+    model.addConstrs((x.sum("*", s) >= de[s] for s in S), name="c3")
 
     # Solve
     model.optimize()
@@ -78,6 +77,51 @@ def solve_min_shipping_cost(instance):
     }
 
 
+def solve_min_shipping_cost_flow(instance):
+    """
+    Return optimal shipping for minimum expected total cost as a min cost flow
+    """
+    E, F, S, D, c_exp, mu_exp, su, de = instance
+
+    # Nodes numbered factories first, then distribution centers, then stores
+    index = {k: i for i, k in enumerate(list(F) + list(D) + list(S))}
+    u = np.array([index[a] for a, _ in E], dtype=np.int64)
+    v = np.array([index[b] for _, b in E], dtype=np.int64)
+
+    return solve_min_shipping_cost_arrays((
+        len(F), len(D), len(S), u, v,
+        np.array([c_exp[e] for e in E]), np.array([mu_exp[e] for e in E]),
+        np.array([su[f] for f in F]), np.array([de[s] for s in S])
+    ))
+
+
+def solve_min_shipping_cost_arrays(instance):
+    """
+    Return optimal shipping for minimum expected total cost as a min cost flow on an array instance
+    A source feeds the factories up to their supply and the stores drain to a sink up to their demand,
+    the constraint matrix is totally unimodular so the flow is integral without branching
+    """
+    nf, nd, ns, u, v, c_exp, mu_exp, su, de = instance
+    n = nf + nd + ns
+    source, sink = n, n + 1
+
+    # Routes with integer capacities, rounded within the integrality tolerance of the MIP, then supply and demand arcs
+    u = np.concatenate([u, np.full(nf, source), np.arange(nf + nd, n)])
+    v = np.concatenate([v, np.arange(nf), np.full(ns, sink)])
+    cap = np.concatenate([np.floor(mu_exp + 1e-5), su, de]).astype(float)
+    cost = np.concatenate([c_exp, np.zeros(nf + ns)])
+
+    demand = de.sum()
+    value, objval, flow = min_cost_flow(n + 2, u, v, cap, cost, source, sink, demand)
+    if value < demand:
+        raise ValueError("demand cannot be met.")
+
+    return {
+        "objval": objval,
+        "x": flow[:len(c_exp)].tolist()
+    }
+
+
 def solve_sudoku(instance):
     """
     Return optimal solution for sudoku
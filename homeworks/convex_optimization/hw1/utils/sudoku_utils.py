@@ -0,0 +1,316 @@
+from multiprocessing import Pool
+from itertools import product
+import random
+import math
+
+
+# Cell symbols of the one line per puzzle format, empty cells are "." or "0"
+SYMBOLS = "123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+
+# Square block structures by number of cells, built once per process
+_structures = {}
+
+
+def get_sudoku_structure(size, B=None):
+    """
+    Return units and peers of every cell of a size by size board, cells are numbered row by row
+    Blocks come from B when given, square blocks of side sqrt(size) otherwise
+    """
+    box = math.isqrt(size)
+    if B is None:
+        B = {
+            k: [((k // box) * box + di, (k % box) * box + dj) for di in range(box) for dj in range(box)]
+            for k in range(size)
+        }
+
+    rows = [[i * size + j for j in range(size)] for i in range(size)]
+    cols = [[i * size + j for i in range(size)] for j in range(size)]
+    blocks = [[i * size + j for i, j in B[k]] for k in B]
+    units = rows + cols + blocks
+
+    # Peers share a unit with the cell
+    peers = [set() for _ in range(size * size)]
+    for unit in units:
+        for c in unit:
+            peers[c].update(unit)
+    peers = [tuple(p - {c}) for c, p in enumerate(peers)]
+
+    return size, units, peers
+
+
+def solve_sudoku_grid(grid, structure=None, limit=1, max_nodes=None):
+    """
+    Return up to limit solutions of a puzzle, a grid is a row by row list of values with 0 for empty cells,
+    None when the search runs out of max_nodes nodes
+    Depth first search on bitmask candidate sets, every branch is closed under naked and hidden singles
+    """
+    size = math.isqrt(len(grid))
+    size, units, peers = structure or get_sudoku_structure(size)
+    full = (1 << size) - 1
+
+    # Givens are singles waiting to be eliminated from their peers
+    cand = [1 << (g - 1) if g else full for g in grid]
+    solutions = []
+    stack = [(cand, [c for c, g in enumerate(grid) if g])]
+
+    nodes = 0
+
+    while stack:
+        if max_nodes is not None and nodes >= max_nodes: return None
+        nodes += 1
+
+        cand, assigned = stack.pop()
+        if not _propagate(cand, assigned, units, peers, full): continue
+
+        # Branch on the open cell with the fewest candidates
+        cell, fewest = -1, size + 1
+        for c, m in enumerate(cand):
+            if m & (m - 1):
+                k = m.bit_count()
+                if k < fewest:
+                    cell, fewest = c, k
+                    if k == 2: break
+
+        if cell < 0:
+            solutions.append([m.bit_length() for m in cand])
+            if len(solutions) >= limit: break
+            continue
+
+        # Smallest candidate is explored first
+        bits = []
+        m = cand[cell]
+        while m:
+            bit = m & -m
+            bits.append(bit)
+            m ^= bit
+        for bit in reversed(bits):
+            child = cand.copy()
+            child[cell] = bit
+            stack.append((child, [cell]))
+
+    return solutions
+
+
+def count_sudoku_solutions(grid, structure=None, limit=2, max_nodes=None):
+    """
+    Return number of solutions of a puzzle, counting stops at limit, None when the search runs out of max_nodes nodes
+    """
+    solutions = solve_sudoku_grid(grid, structure, limit, max_nodes)
+    return len(solutions) if solutions is not None else None
+
+
+def solve_sudoku_propagation(instance):
+    """
+    Return solution for sudoku without a MIP, same instance and output as solve_sudoku
+    """
+    N, B, a = instance
+    size = len(N)
+
+    solutions = solve_sudoku_grid(get_sudoku_grid(instance), get_sudoku_structure(size, B))
+    if not solutions:
+        raise ValueError("sudoku has no solution.")
+
+    return {
+        'x': {(i, j): solutions[0][i * size + j] for i, j in product(range(size), range(size))}
+    }
+
+
+def solve_sudoku_batch(grids, processes=None, chunksize=64):
+    """
+    Return first solution of every puzzle, None for puzzles without solutions, across a process pool
+    """
+    if processes == 1:
+        return [_solve_first(grid) for grid in grids]
+
+    with Pool(processes) as pool:
+        return pool.map(_solve_first, grids, chunksize)
+
+
+def solve_sudoku_file(path, out_path=None, processes=None, chunksize=64):
+    """
+    Return solutions of the puzzles of a one line per puzzle file and write them to out_path when given
+    """
+    solutions = solve_sudoku_batch(read_sudoku_file(path), processes, chunksize)
+    if out_path is not None:
+        write_sudoku_file(out_path, solutions)
+
+    return solutions
+
+
+def generate_sudoku(rng, box=3, min_givens=24, structure=None, max_nodes=1000):
+    """
+    Return a puzzle with a unique solution and its solution, givens are removed from a random full grid
+    while the solution stays unique, fewer givens make harder puzzles
+    A given whose uniqueness check runs out of max_nodes search nodes is kept
+    """
+    size = box * box
+    solution = get_full_sudoku(rng, box, structure, max_nodes)
+    puzzle = solution.copy()
+    givens = size * size
+
+    for c in rng.sample(range(size * size), size * size):
+        if givens <= min_givens: break
+
+        # Keep the given when a second solution appears without it
+        puzzle[c] = 0
+        if count_sudoku_solutions(puzzle, structure, 2, max_nodes) != 1:
+            puzzle[c] = solution[c]
+        else:
+            givens -= 1
+
+    return puzzle, solution
+
+
+def generate_sudoku_file(path, count, box=3, min_givens=24, seed=None, processes=None, chunksize=16):
+    """
+    Return count generated puzzles and write them to a one line per puzzle file, across a process pool
+    """
+    seeds = random.Random(seed).sample(range(2**62), count)
+    tasks = [(s, box, min_givens) for s in seeds]
+
+    if processes == 1:
+        puzzles = [_generate(task) for task in tasks]
+    else:
+        with Pool(processes) as pool:
+            puzzles = pool.map(_generate, tasks, chunksize)
+
+    write_sudoku_file(path, puzzles)
+
+    return puzzles
+
+
+def get_full_sudoku(rng, box=3, structure=None, max_nodes=1000):
+    """
+    Return a random full grid, the diagonal blocks are independent so they are filled at random before solving,
+    new blocks are drawn when the search runs out of max_nodes nodes
+    """
+    size = box * box
+    solutions = None
+    while not solutions:
+        grid = [0] * (size * size)
+        for b in range(box):
+            for k, v in enumerate(rng.sample(range(1, size + 1), size)):
+                grid[(b * box + k // box) * size + b * box + k % box] = v
+        solutions = solve_sudoku_grid(grid, structure, max_nodes=max_nodes)
+
+    return shuffle_sudoku(solutions[0], rng)
+
+
+def get_sudoku_grid(instance):
+    """
+    Return grid of the givens of a sudoku instance
+    """
+    N, B, a = instance
+    size = len(N)
+    grid = [0] * (size * size)
+    for (i, j, n), given in a.items():
+        if given:
+            grid[i * size + j] = n + 1
+
+    return grid
+
+
+def shuffle_sudoku(grid, rng):
+    """
+    Return an equivalent puzzle under a random relabeling, band, row, stack and column permutation and transposition
+    """
+    size = math.isqrt(len(grid))
+    box = math.isqrt(size)
+
+    def order():
+        bands = rng.sample(range(box), box)
+        return [b * box + r for b in bands for r in rng.sample(range(box), box)]
+
+    labels = [0] + rng.sample(range(1, size + 1), size)
+    rows, cols = order(), order()
+    if rng.random() < 0.5:
+        return [labels[grid[cols[j] * size + rows[i]]] for i in range(size) for j in range(size)]
+
+    return [labels[grid[rows[i] * size + cols[j]]] for i in range(size) for j in range(size)]
+
+
+def read_sudoku_file(path):
+    """
+    Return grids of a file with one puzzle per line, blank lines are skipped
+    """
+    with open(path) as f:
+        return [parse_sudoku(line) for line in f if line.strip()]
+
+
+def write_sudoku_file(path, grids):
+    """
+    Write grids to a file with one puzzle per line, None is written as an empty line
+    """
+    with open(path, 'w') as f:
+        f.writelines((format_sudoku(grid) if grid is not None else "") + "\n" for grid in grids)
+
+
+def parse_sudoku(line):
+    """
+    Return grid of a one line puzzle
+    """
+    return [0 if ch in ".0" else SYMBOLS.index(ch) + 1 for ch in line.strip()]
+
+
+def format_sudoku(grid):
+    """
+    Return one line puzzle of a grid
+    """
+    return "".join(SYMBOLS[g - 1] if g else "." for g in grid)
+
+
+def _solve_first(grid):
+    solutions = solve_sudoku_grid(grid, _get_structure(len(grid)))
+    return solutions[0] if solutions else None
+
+
+def _generate(task):
+    seed, box, min_givens = task
+    return generate_sudoku(random.Random(seed), box, min_givens, _get_structure(box ** 4))[0]
+
+
+def _get_structure(cells):
+    """
+    Return square block structure of boards with the given number of cells, built once per process
+    """
+    if cells not in _structures:
+        _structures[cells] = get_sudoku_structure(math.isqrt(cells))
+    return _structures[cells]
+
+
+def _propagate(cand, assigned, units, peers, full):
+    """
+    Return False on a contradiction, otherwise fix naked and hidden singles in place until none is left
+    """
+    while True:
+        # Naked singles: remove a fixed value from all peers
+        while assigned:
+            c = assigned.pop()
+            bit = cand[c]
+            for p in peers[c]:
+                m = cand[p]
+                if m & bit:
+                    m ^= bit
+                    if not m: return False
+                    cand[p] = m
+                    if not m & (m - 1): assigned.append(p)
+
+        # Hidden singles: a value with a single place in a unit
+        for unit in units:
+            once = twice = 0
+            for c in unit:
+                m = cand[c]
+                twice |= once & m
+                once |= m
+            if once != full: return False
+
+            single = once & ~twice
+            if not single: continue
+            for c in unit:
+                m = cand[c] & single
+                if m and cand[c] != m:
+                    if m & (m - 1): return False
+                    cand[c] = m
+                    assigned.append(c)
+
+        if not assigned: return True
\ No newline at end of file
@@ -0,0 +1,33 @@
+from utils.benchmark_utils import *
+
+
+# silence the LP solver logs
+gp.setParam('OutputFlag', 0)
+
+# dinic against the LP models, up to 10^6 arcs
+results = benchmark_max_flow([(100, 500), (1000, 10**4), (10**4, 10**5), (10**5, 10**6)])
+print_results(results)
+
+# warm re-solves of the persistent LP models for new capacity vectors
+results = benchmark_resolve([(100, 500), (1000, 5000), (5000, 25000)])
+print_results(results)
+
+# all pairs minimum cuts with n - 1 max flows against one LP per pair
+results = benchmark_all_pairs_min_cut([(10, 30), (20, 60), (30, 100), (1000, 5000)])
+print_results(results)
+
+# min ships as a bipartite matching against the MIP
+results = benchmark_min_ships([12, 15, 20, 40, 1000, 5000])
+print_results(results)
+
+# build and solve time of the matrix-form min total travel time model
+results = benchmark_min_total_travel_time([8, 12, 20, 40])
+print_results(results)
+
+# eager against lazy compatibility constraints
+results = benchmark_lazy_conflicts([10, 12, 20, 30])
+print_results(results)
+
+# seeded cargo instances with their compatibility matrix, saved and reloaded as .npz
+results = benchmark_cargo_instances([10**3, 5 * 10**3, 10**4])
+print_results(results)
\ No newline at end of file
@@ -0,0 +1,57 @@
+import gurobipy as gp
+from gurobipy import GRB
+import time
+
+
+class MaxFlowModel:
+    """
+    Max flow LP built once for a network topology and re-solved for new capacity vectors
+    Capacities are variable upper bounds, so an update keeps the previous basis dual feasible for a dual simplex warm start
+    """
+    def __init__(self, G, s='s', t='t'):
+        start_time = time.perf_counter()
+        self.edges = list(G.edges)
+
+        # Create model
+        self.model = gp.Model(name="max-flow")
+        self.model.setParam('OutputFlag', 0)
+        self.model.setParam('Method', 1)
+
+        # Set variables, bounded by the capacities
+        self.x = self.model.addVars(self.edges, lb=0, ub=[c for _, _, c in G.edges(data='capacity')], name='x')
+        self.x_vars = [self.x[e] for e in self.edges]
+
+        # Define objective function
+        self.model.setObjective(gp.quicksum(self.x[s, j] for j in G.successors(s)), GRB.MAXIMIZE)
+
+        # Add flow conservation constraints
+        self.model.addConstrs((gp.quicksum(self.x[j, i] for j in G.predecessors(i)) == gp.quicksum(self.x[i, j] for j in G.successors(i))
+                               for i in G.nodes if i not in [s, t]), name='c2')
+        self.model.update()
+
+        self.build_time = time.perf_counter() - start_time
+        self.solve_time = None
+
+
+    def solve(self, capacities=None):
+        """
+        Update capacities in bulk, given as a dict of edges or a sequence in edge order, and return the max flow value
+        """
+        start_time = time.perf_counter()
+
+        if capacities is not None:
+            if isinstance(capacities, dict):
+                capacities = [capacities[e] for e in self.edges]
+            self.model.setAttr('UB', self.x_vars, list(capacities))
+
+        self.model.optimize()
+        self.solve_time = time.perf_counter() - start_time
+
+        return self.model.objVal
+
+
+    def get_flows(self):
+        """
+        Return flow of every edge
+        """
+        return dict(zip(self.edges, self.model.getAttr('X', self.x_vars)))
\ No newline at end of file
@@ -0,0 +1,60 @@
+import gurobipy as gp
+from gurobipy import GRB
+import time
+
+
+class MinCutModel:
+    """
+    Min cut LP built once for a network topology and re-solved for new capacity vectors
+    Capacities are objective coefficients, so an update keeps the previous basis primal feasible for a primal simplex warm start
+    """
+    def __init__(self, G, s='s', t='t'):
+        start_time = time.perf_counter()
+        self.nodes = list(G.nodes)
+        self.edges = list(G.edges)
+
+        # Create model
+        self.model = gp.Model(name="min-cut")
+        self.model.setParam('OutputFlag', 0)
+        self.model.setParam('Method', 0)
+
+        # Set variables
+        self.v = self.model.addVars(self.edges, lb=0, name='v')
+        self.u = self.model.addVars(self.nodes, name='u')
+        self.v_vars = [self.v[e] for e in self.edges]
+
+        # Define objective function
+        self.model.setObjective(gp.quicksum(self.v[i, j] * c for i, j, c in G.edges(data='capacity')), GRB.MINIMIZE)
+
+        # Add constraints
+        self.model.addConstrs((self.u[i] - self.u[j] <= self.v[i, j] for i, j in self.edges), name='c1')
+        self.model.addConstr(self.u[s] == 1, name='c2')
+        self.model.addConstr(self.u[t] == 0, name='c3')
+        self.model.update()
+
+        self.build_time = time.perf_counter() - start_time
+        self.solve_time = None
+
+
+    def solve(self, capacities=None):
+        """
+        Update capacities in bulk, given as a dict of edges or a sequence in edge order, and return the min cut value
+        """
+        start_time = time.perf_counter()
+
+        if capacities is not None:
+            if isinstance(capacities, dict):
+                capacities = [capacities[e] for e in self.edges]
+            self.model.setAttr('Obj', self.v_vars, list(capacities))
+
+        self.model.optimize()
+        self.solve_time = time.perf_counter() - start_time
+
+        return self.model.objVal
+
+
+    def get_s_side(self):
+        """
+        Return the nodes on the s side of the cut
+        """
+        return {i for i, val in zip(self.nodes, self.model.getAttr('X', [self.u[i] for i in self.nodes])) if val > 0.5}
\ No newline at end of file
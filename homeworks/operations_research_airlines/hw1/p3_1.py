@@ -1,5 +1,5 @@
 from utils.solve_utils import *
-import numpy as np
+from utils.solution_utils import *
 
 
 # variables
@@ -17,16 +17,8 @@ M = 15
 model = min_ship_solver(num_of_cargoes, DD, PO, PD, sailing_time, M)
 
 # get opt model variables
-x = np.zeros((num_of_cargoes, num_of_cargoes))
-y = np.zeros((num_of_cargoes))
-for var in model.getVars():
-    if var.varName.startswith('x[') and ']' in var.varName:
-        indices = var.varName[2:-1].split(',')
-        i = int(indices[0]); j = int(indices[1])
-        x[i][j] = var.x
-    elif var.varName[0] == 'y':
-        i = int(var.varName[2])
-        y[i] = var.x
+solution = get_solution(model)
+x, y = solution['x'], solution['y']
         
 # print results
 print('Min-ships - objective function value: %f' % model.objVal)
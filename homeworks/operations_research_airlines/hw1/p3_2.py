@@ -1,5 +1,5 @@
 from utils.solve_utils import *
-import numpy as np
+from utils.solution_utils import *
 
 
 # variables
@@ -17,13 +17,9 @@ M = 15
 model = min_total_travel_time_solver(num_of_cargoes, DD, PO, PD, sailing_time, M)
 
 # get opt model variables
-x = np.zeros((num_of_cargoes, num_of_cargoes))
-for var in model.getVars():
-    if var.varName.startswith('x[') and ']' in var.varName:
-        indices = var.varName[2:-1].split(',')
-        i = int(indices[0]); j = int(indices[1])
-        x[i][j] = var.x
+x = get_solution(model)['x']
         
 # print results
 print('Min total travel time - objective function value: %f' % model.objVal)
+print('build time: %f, solve time: %f' % (model._build_time, model.Runtime))
 print("\nvariables:\nx: ", x)
\ No newline at end of file
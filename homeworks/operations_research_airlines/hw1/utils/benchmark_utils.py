@@ -0,0 +1,209 @@
+from utils.graph_utils import *
+from utils.solve_utils import *
+from utils.flow_utils import *
+from classes.MaxFlowModel import *
+from classes.MinCutModel import *
+import numpy as np
+import tempfile
+import time
+import os
+
+
+# dinic max flow against the max flow and min cut LP models on random networks
+def benchmark_max_flow(sizes, lp_limit=10**5, seed=0):
+    results = []
+    for n, m in sizes:
+        G = network_generator(n, m, seed=seed)
+
+        start_time = time.perf_counter()
+        value, _, s_side = dinic_max_flow(G)
+        row = {'n': n, 'm': m, 'dinic_time': time.perf_counter() - start_time, 'dinic_value': value}
+
+        # capacity of the cut around the s side
+        row['cut_value'] = sum(c for i, j, c in G.edges(data='capacity') if i in s_side and j not in s_side)
+
+        # the LP models are only solved on the smaller networks
+        if m <= lp_limit:
+            start_time = time.perf_counter()
+            row['max_flow_lp_value'] = max_flow_solver(G).objVal
+            row['max_flow_lp_time'] = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            row['min_cut_lp_value'] = min_cut_solver(G).objVal
+            row['min_cut_lp_time'] = time.perf_counter() - start_time
+
+        row['match'] = all(abs(row.get(k, value) - value) < 1e-6 for k in ['cut_value', 'max_flow_lp_value', 'min_cut_lp_value'])
+        results.append(row)
+
+    return results
+
+
+# warm re-solves of the persistent models against rebuilding the LP models for new capacities
+def benchmark_resolve(sizes, num_solves=20, seed=0):
+    rng = np.random.default_rng(seed)
+    results = []
+    for n, m in sizes:
+        G = network_generator(n, m, seed=seed)
+        max_flow_model, min_cut_model = MaxFlowModel(G), MinCutModel(G)
+        max_flow_model.solve()
+        min_cut_model.solve()
+
+        warm_times, rebuild_times, warm_iters, cold_iters, match = [], [], [], [], True
+        for _ in range(num_solves):
+            capacities = rng.integers(10, 21, size=m).tolist()
+            nx.set_edge_attributes(G, dict(zip(G.edges, capacities)), 'capacity')
+
+            value = max_flow_model.solve(capacities)
+            warm_times.append(max_flow_model.solve_time)
+            warm_iters.append(max_flow_model.model.IterCount)
+            match &= abs(min_cut_model.solve(capacities) - value) < 1e-6
+            match &= abs(dinic_max_flow(G)[0] - value) < 1e-6
+
+            start_time = time.perf_counter()
+            model = max_flow_solver(G)
+            rebuild_times.append(time.perf_counter() - start_time)
+            cold_iters.append(model.IterCount)
+
+        results.append({
+            'n': n, 'm': m,
+            'build_time': max_flow_model.build_time,
+            'warm_solve_time': float(np.mean(warm_times)),
+            'rebuild_solve_time': float(np.mean(rebuild_times)),
+            'warm_iterations': float(np.mean(warm_iters)),
+            'cold_iterations': float(np.mean(cold_iters)),
+            'match': match
+        })
+
+    return results
+
+
+# all pairs minimum cuts from the Gomory-Hu tree against one min cut LP per pair
+def benchmark_all_pairs_min_cut(sizes, lp_limit=30, seed=0):
+    results = []
+    for n, m in sizes:
+        G = network_generator(n, m, seed=seed)
+        nodes = list(G.nodes)
+
+        start_time = time.perf_counter()
+        T = gomory_hu_tree(G)
+        values = all_pairs_min_cut(T)
+        row = {'n': n, 'm': m, 'gomory_hu_time': time.perf_counter() - start_time}
+
+        # the LP needs both arc directions to model undirected capacities
+        if n <= lp_limit:
+            D = G.to_undirected().to_directed()
+            start_time = time.perf_counter()
+            lp_values = {(i, j): min_cut_solver(D, nodes[i], nodes[j]).objVal for i in range(n) for j in range(i + 1, n)}
+            row['lp_time'] = time.perf_counter() - start_time
+            row['match'] = all(abs(values[i, j] - val) < 1e-6 for (i, j), val in lp_values.items())
+
+        results.append(row)
+
+    return results
+
+
+# matching solver against the min ships MIP on random cargo sets
+def benchmark_min_ships(sizes, mip_limit=40, seed=0):
+    results = []
+    for num_of_cargoes in sizes:
+        DD, PO, PD, sailing_time = _random_cargo_instance(num_of_cargoes, seed)
+
+        start_time = time.perf_counter()
+        num_ships, _, _ = min_ship_matching_solver(num_of_cargoes, DD, PO, PD, sailing_time)
+        row = {'cargoes': num_of_cargoes, 'matching_time': time.perf_counter() - start_time, 'matching_ships': num_ships}
+
+        # the MIP has cargoes^2 binaries and is only solved on small sets
+        if num_of_cargoes <= mip_limit:
+            start_time = time.perf_counter()
+            model = min_ship_solver(num_of_cargoes, DD, PO, PD, sailing_time, M=max(DD) + 2 * max(max(d.values()) for d in sailing_time.values()))
+            row['mip_time'] = time.perf_counter() - start_time
+            row['mip_ships'] = model.objVal
+            row['match'] = abs(model.objVal - num_ships) < 1e-6
+
+        results.append(row)
+
+    return results
+
+
+# build and solve time of the matrix-form min total travel time model
+def benchmark_min_total_travel_time(sizes, M=100, time_limit=60, seed=0):
+    results = []
+    for num_of_cargoes in sizes:
+        DD, PO, PD, sailing_time = _random_cargo_instance(num_of_cargoes, seed)
+        model = min_total_travel_time_solver(num_of_cargoes, DD, PO, PD, sailing_time, M, time_limit=time_limit)
+        results.append({
+            'cargoes': num_of_cargoes,
+            'num_vars': model.NumVars,
+            'num_constrs': model.NumConstrs,
+            'build_time': model._build_time,
+            'solve_time': model.Runtime,
+            'objval': model.objVal if model.SolCount else None
+        })
+
+    return results
+
+
+# eager big-M compatibility constraints against lazy conflict cuts
+def benchmark_lazy_conflicts(sizes, M=100, time_limit=60, seed=0):
+    results = []
+    for num_of_cargoes in sizes:
+        DD, PO, PD, sailing_time = _random_cargo_instance(num_of_cargoes, seed)
+        for name, solver in [('min_ships', min_ship_solver), ('min_total_travel_time', min_total_travel_time_solver)]:
+            for lazy in [False, True]:
+                start_time = time.perf_counter()
+                model = solver(num_of_cargoes, DD, PO, PD, sailing_time, M, lazy=lazy, time_limit=time_limit)
+                results.append({
+                    'model': name, 'cargoes': num_of_cargoes, 'lazy': lazy,
+                    'num_constrs': model.NumConstrs,
+                    'num_nonzeros': model.NumNZs,
+                    'time': time.perf_counter() - start_time,
+                    'num_lazy_cuts': model._num_lazy_cuts,
+                    'objval': model.objVal if model.SolCount else None
+                })
+
+    return results
+
+
+# generation, .npz save and reload time of cargo instances
+def benchmark_cargo_instances(sizes, seed=0):
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for num_of_cargoes in sizes:
+            path = os.path.join(tmp, f'cargoes_{num_of_cargoes}.npz')
+
+            start_time = time.perf_counter()
+            instance = cargo_instance_generator(num_of_cargoes, num_origins=3, num_destinations=4, seed=seed)
+            generate_time = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            save_cargo_instance(path, instance)
+            save_time = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            loaded = load_cargo_instance(path)
+            load_time = time.perf_counter() - start_time
+
+            results.append({
+                'cargoes': num_of_cargoes,
+                'generate_time': generate_time,
+                'save_time': save_time,
+                'load_time': load_time,
+                'file_mb': os.path.getsize(path) / 2**20,
+                'match': bool((loaded['compatibility'] == instance['compatibility']).all()) and loaded['DD'] == instance['DD']
+            })
+
+    return results
+
+
+# due dates, ports and sailing times of a generated cargo instance
+def _random_cargo_instance(num_of_cargoes, seed=None):
+    instance = cargo_instance_generator(num_of_cargoes, num_origins=3, num_destinations=4, seed=seed)
+    return instance['DD'], instance['PO'], instance['PD'], instance['sailing_time']
+
+
+# print benchmark results as a table
+def print_results(results):
+    keys = list(dict.fromkeys(k for row in results for k in row))
+    print(" ".join(f"{k:>18}" for k in keys))
+    for row in results:
+        print(" ".join(f"{row[k]:>18.6g}" if isinstance(row.get(k), float) else f"{str(row.get(k, '-')):>18}" for k in keys))
\ No newline at end of file
@@ -0,0 +1,181 @@
+import networkx as nx
+import numpy as np
+
+
+# max flow with Dinic's algorithm over CSR residual arrays
+# returns the flow value, the flow of every arc of G and the s side of a minimum cut
+def dinic_max_flow(G, s='s', t='t'):
+    nodes = list(G.nodes)
+    index = {x: i for i, x in enumerate(nodes)}
+    arcs = list(G.edges(data='capacity'))
+    u = np.array([index[i] for i, _, _ in arcs], dtype=np.int64)
+    v = np.array([index[j] for _, j, _ in arcs], dtype=np.int64)
+    c = np.array([cap for _, _, cap in arcs])
+
+    value, flow, s_side = dinic_arrays(len(nodes), u, v, c, index[s], index[t])
+
+    flows = dict(zip(G.edges, flow.tolist()))
+    return value, flows, {nodes[i] for i in np.flatnonzero(s_side).tolist()}
+
+
+# max flow with Dinic's algorithm on arc arrays
+# returns the flow value, the flow array and the mask of nodes reachable from s in the final residual graph
+def dinic_arrays(n, u, v, c, s, t):
+    m = len(u)
+    csr = _residual_csr(n, u, v, c)
+    cap_list = csr[2].tolist()
+    value, level = _dinic(n, csr, cap_list, s, t)
+
+    # flow of an arc is its capacity minus the remaining residual capacity
+    flow = c - np.array(cap_list)[csr[4]] if m else np.zeros(0)
+    return value, flow, level >= 0
+
+
+# flow equivalent tree with Gusfield's algorithm, n - 1 max flow calls on one residual graph
+# arcs of G count as undirected edges of the same capacity, tree edge weights are minimum cut values
+def gomory_hu_tree(G):
+    nodes = list(G.nodes)
+    n = len(nodes)
+    index = {x: i for i, x in enumerate(nodes)}
+    arcs = list(G.edges(data='capacity'))
+    u = np.array([index[i] for i, _, _ in arcs], dtype=np.int64)
+    v = np.array([index[j] for _, j, _ in arcs], dtype=np.int64)
+    c = np.array([cap for _, _, cap in arcs])
+    csr = _residual_csr(n, np.concatenate([u, v]), np.concatenate([v, u]), np.concatenate([c, c]))
+
+    T = nx.Graph()
+    T.add_nodes_from(nodes)
+    parent = np.zeros(n, dtype=np.int64)
+    later = np.arange(n)
+
+    for i in range(1, n):
+        value, level = _dinic(n, csr, csr[2].tolist(), i, parent[i])
+        T.add_edge(nodes[i], nodes[parent[i]], weight=value)
+
+        # later nodes with the same parent on the side of i hang from i
+        parent[(later > i) & (parent == parent[i]) & (level >= 0)] = i
+
+    return T
+
+
+# minimum cut value between a and b, the lightest edge on their tree path in O(n)
+def min_cut_value(T, a, b):
+    path = nx.shortest_path(T, a, b)
+    return min((T.edges[x, y]['weight'] for x, y in zip(path, path[1:])), default=float('inf'))
+
+
+# matrix of all pairs minimum cut values, one tree traversal per node
+def all_pairs_min_cut(T):
+    nodes = list(T.nodes)
+    index = {x: i for i, x in enumerate(nodes)}
+    values = np.full((len(nodes), len(nodes)), np.inf)
+
+    for a in nodes:
+        row = values[index[a]]
+        for x, y in nx.bfs_edges(T, a):
+            row[index[y]] = min(row[index[x]], T.edges[x, y]['weight'])
+
+    return values
+
+
+# dinic phases on a residual graph, the residual capacities in cap_list are updated in place
+# returns the flow value and the bfs levels of the last phase, -1 outside the s side of the cut
+def _dinic(n, csr, cap_list, s, t):
+    start, head, _, rev, _ = csr
+
+    # python lists are much faster than numpy arrays for scalar access in the search loop
+    head_list, rev_list, end = head.tolist(), rev.tolist(), start[1:].tolist()
+    value = 0
+
+    while True:
+        level = _bfs_levels(n, start, head, np.array(cap_list), s, t)
+        if level[t] < 0: break
+        value += _blocking_flow(start.tolist(), end, head_list, rev_list, cap_list, level.tolist(), s, t)
+
+    return value, level
+
+
+# residual graph in CSR order, every arc is stored next to the other arcs leaving its tail
+def _residual_csr(n, u, v, c):
+    m = len(u)
+    tail = np.concatenate([u, v])
+    order = np.argsort(tail, kind='stable')
+
+    # position of every original forward/backward arc after sorting
+    position = np.empty(2 * m, dtype=np.int64)
+    position[order] = np.arange(2 * m)
+
+    start = np.zeros(n + 1, dtype=np.int64)
+    start[1:] = np.cumsum(np.bincount(tail, minlength=n))
+    head = np.concatenate([v, u])[order]
+    cap = np.concatenate([c, np.zeros(m, dtype=c.dtype)])[order]
+    rev = position[(order + m) % (2 * m)]
+
+    return start, head, cap, rev, position[:m]
+
+
+# bfs distances from s over arcs with residual capacity, one vectorized step per level
+# the search stops at the level of t, deeper nodes cannot be on shortest augmenting paths
+def _bfs_levels(n, start, head, cap, s, t):
+    level = np.full(n, -1, dtype=np.int64)
+    level[s] = 0
+    frontier = np.array([s])
+    depth = 0
+
+    while len(frontier) and level[t] < 0:
+        depth += 1
+
+        # all arcs leaving the frontier
+        counts = start[frontier + 1] - start[frontier]
+        offsets = np.repeat(start[frontier] - np.cumsum(counts) + counts, counts)
+        arcs = offsets + np.arange(counts.sum())
+
+        arcs = arcs[cap[arcs] > 0]
+        nxt = head[arcs]
+        nxt = np.sort(nxt[level[nxt] < 0])
+        nxt = nxt[np.r_[True, nxt[1:] != nxt[:-1]]] if len(nxt) else nxt
+        level[nxt] = depth
+        frontier = nxt
+
+    return level
+
+
+# blocking flow in the level graph with current arc pointers and an explicit path stack
+def _blocking_flow(it, end, head, rev, cap, level, s, t):
+    total = 0
+    path = []
+    x = s
+
+    while True:
+        if x == t:
+            # augment by the bottleneck and restart from the tail of the first saturated arc
+            bottleneck = min(cap[a] for a in path)
+            for a in path:
+                cap[a] -= bottleneck
+                cap[rev[a]] += bottleneck
+            total += bottleneck
+
+            k = next(i for i, a in enumerate(path) if cap[a] == 0)
+            del path[k:]
+            x = head[path[-1]] if path else s
+            continue
+
+        # advance along the current arc
+        a = it[x]
+        while a < end[x] and (cap[a] == 0 or level[head[a]] != level[x] + 1):
+            a += 1
+        it[x] = a
+
+        if a < end[x]:
+            path.append(a)
+            x = head[a]
+            continue
+
+        # retreat from a dead end
+        if x == s: break
+        level[x] = -1
+        a = path.pop()
+        x = head[rev[a]]
+        it[x] += 1
+
+    return total
\ No newline at end of file
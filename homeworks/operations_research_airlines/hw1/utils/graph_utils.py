@@ -1,44 +1,67 @@
 import networkx as nx
-import random
+import numpy as np
 import matplotlib.pyplot as plt
 
 
 # network graph generator
-def network_generator(n, m):
+def network_generator(n, m, seed=None):
     if m < n or m > n*(n-1)/2:
         raise ValueError("wrong number of edges.")
-    
-    # create complete graph
-    G = nx.complete_graph(n)
-    
-    edges = list(G.edges())
-    random.shuffle(edges)
-    
-    # removes valid edges
-    while G.number_of_edges() > m:
-        u, v = edges.pop()
-        G.remove_edge(u, v)
 
-        # make sure edge is valid
-        if not nx.is_connected(G) or any(d == 1 for _, d in G.degree()):
-            G.add_edge(u, v)
+    rng = np.random.default_rng(seed)
 
-    # transform G to a directed graph D
-    D = nx.DiGraph()
-    for u, v in G.edges:
-        D.add_edge(u, v)
+    # random Hamiltonian cycle keeps the graph connected with minimum degree 2
+    perm = rng.permutation(n)
+    keys = _edge_keys(perm, np.roll(perm, -1), n)
+
+    # add the remaining edges among the missing pairs
+    keys = np.concatenate([keys, _random_extra_keys(n, m - n, keys, rng)])
 
     # rename s and t vertices
-    D = nx.relabel_nodes(D, {0: 's', n-1: 't'})
+    names = list(range(n))
+    names[0], names[n-1] = 's', 't'
 
-    # add capacities
-    capacities = {e: random.randint(10, 20) for e in D.edges()}
-    nx.set_edge_attributes(D, capacities, 'capacity')
+    # transform G to a directed graph D with capacities, arcs go from lower to higher index
+    capacities = rng.integers(10, 21, size=m)
+    D = nx.DiGraph()
+    D.add_edges_from(
+        (names[i], names[j], {'capacity': c})
+        for i, j, c in zip((keys // n).tolist(), (keys % n).tolist(), capacities.tolist())
+    )
 
     # return the connected graph
     return D
 
 
+# unique integer key of every undirected edge
+def _edge_keys(u, v, n):
+    return np.minimum(u, v).astype(np.int64) * n + np.maximum(u, v)
+
+
+# k distinct random edge keys not in keys
+def _random_extra_keys(n, k, keys, rng):
+    if k == 0: return np.empty(0, dtype=np.int64)
+
+    # dense graphs: sample directly among all missing pairs
+    if 2 * (len(keys) + k) > n * (n - 1) // 2:
+        i, j = np.triu_indices(n, 1)
+        free = i * n + j
+        return rng.choice(free[~np.isin(free, keys)], k, replace=False)
+
+    # sparse graphs: draw random pairs until there are enough new ones
+    extra = np.empty(0, dtype=np.int64)
+    while len(extra) < k:
+        size = 2 * (k - len(extra)) + 16
+        a, b = rng.integers(0, n, size), rng.integers(0, n, size)
+        extra = np.sort(np.concatenate([extra, _edge_keys(a[a != b], b[a != b], n)]))
+
+        # drop duplicates and existing edges with a sort-based pass
+        extra = extra[np.r_[True, extra[1:] != extra[:-1]]]
+        extra = extra[~np.isin(extra, keys)]
+
+    return rng.choice(extra, k, replace=False)
+
+
 # show graph
 def show_graph(G):
     edge_labels = nx.get_edge_attributes(G, 'capacity')
@@ -0,0 +1,102 @@
+import numpy as np
+
+
+# random cargo instance with sorted due dates, origin and destination ports and sailing times
+# ports lie on a grid and sailing times are manhattan distances plus one, so they satisfy the triangle inequality
+# the second origin is the depot 'Y' of the min total travel time model
+def cargo_instance_generator(num_of_cargoes, num_origins=2, num_destinations=3, horizon=None, grid=5, seed=None):
+    if num_origins < 2 or num_destinations < 1:
+        raise ValueError("wrong number of ports.")
+
+    rng = np.random.default_rng(seed)
+
+    # port names, the small instances keep the names of the assignment
+    origins = ['X', 'Y'] + [f'O{k}' for k in range(2, num_origins)]
+    destinations = [chr(ord('A') + k) if k < 26 else f'D{k}' for k in range(num_destinations)]
+
+    # sailing time matrix between origins and destinations
+    points = rng.integers(0, grid, size=(num_origins + num_destinations, 2))
+    T = np.abs(points[:num_origins, None, :] - points[None, num_origins:, :]).sum(axis=2) + 1
+
+    # due dates spread so that ships carry a few cargoes each
+    horizon = horizon or 2 * num_of_cargoes + 10
+    DD = np.sort(rng.integers(1, horizon + 1, size=num_of_cargoes))
+    po = rng.integers(num_origins, size=num_of_cargoes)
+    pd = rng.integers(num_destinations, size=num_of_cargoes)
+
+    return _get_cargo_instance(DD, po, pd, T, origins, destinations)
+
+
+# save a cargo instance with its compatibility matrix to a .npz file
+def save_cargo_instance(path, instance):
+    origins = list(instance['sailing_time'])
+    destinations = list(instance['sailing_time'][origins[0]])
+    np.savez_compressed(
+        path,
+        DD=np.asarray(instance['DD']),
+        PO=np.array(instance['PO']), PD=np.array(instance['PD']),
+        origins=np.array(origins), destinations=np.array(destinations),
+        T=np.array([[instance['sailing_time'][o][d] for d in destinations] for o in origins]),
+        compatibility=instance['compatibility']
+    )
+
+
+# load a cargo instance saved with save_cargo_instance, the compatibility matrix is not recomputed
+def load_cargo_instance(path):
+    # the arrays are read inside the block so the archive is closed afterwards
+    with np.load(path) as data:
+        origins, destinations = data['origins'].tolist(), data['destinations'].tolist()
+        T = data['T']
+
+        return {
+            'num_of_cargoes': len(data['DD']),
+            'DD': data['DD'].tolist(),
+            'PO': data['PO'].tolist(),
+            'PD': data['PD'].tolist(),
+            'sailing_time': {o: {d: int(T[a, b]) for b, d in enumerate(destinations)} for a, o in enumerate(origins)},
+            'compatibility': data['compatibility']
+        }
+
+
+# cargo instance dict from port index arrays, with its compatibility matrix
+def _get_cargo_instance(DD, po, pd, T, origins, destinations):
+    instance = {
+        'num_of_cargoes': len(DD),
+        'DD': DD.tolist(),
+        'PO': [origins[k] for k in po.tolist()],
+        'PD': [destinations[k] for k in pd.tolist()],
+        'sailing_time': {o: {d: int(T[a, b]) for b, d in enumerate(destinations)} for a, o in enumerate(origins)}
+    }
+    instance['compatibility'] = get_compatibility_matrix(
+        len(DD), instance['DD'], instance['PO'], instance['PD'], instance['sailing_time']
+    )
+
+    return instance
+
+
+# cargo j can follow cargo i on the same ship, vectorized big-M condition of the min ships model
+# DD[j] - DD[i] - sailing_time[PO[i]][PD[i]] - sailing_time[PO[j]][PD[i]] >= 0 for j > i
+def get_compatibility_matrix(num_of_cargoes, DD, PO, PD, sailing_time):
+    return np.triu(get_compatibility_slack(num_of_cargoes, DD, PO, PD, sailing_time) >= 0, 1)
+
+
+# pairs (i, j), i < j, that cannot share a ship
+def get_conflict_matrix(num_of_cargoes, DD, PO, PD, sailing_time):
+    return np.triu(get_compatibility_slack(num_of_cargoes, DD, PO, PD, sailing_time) < 0, 1)
+
+
+# left hand side of the big-M condition for every cargo pair (i, j)
+def get_compatibility_slack(num_of_cargoes, DD, PO, PD, sailing_time):
+    origins = list(sailing_time)
+    destinations = list(sailing_time[origins[0]])
+    T = np.array([[sailing_time[o][d] for d in destinations] for o in origins])
+
+    # port indices of every cargo
+    origin_index = {p: k for k, p in enumerate(origins)}
+    destination_index = {p: k for k, p in enumerate(destinations)}
+    po = np.array([origin_index[p] for p in PO[:num_of_cargoes]])
+    pd = np.array([destination_index[p] for p in PD[:num_of_cargoes]])
+    DD = np.asarray(DD[:num_of_cargoes])
+
+    # time cargo i is delivered, then the empty trip from its destination to the origin of j
+    return DD[None, :] - (DD + T[po, pd])[:, None] - T[po[None, :], pd[:, None]]
\ No newline at end of file
@@ -0,0 +1,29 @@
+import gurobipy as gp
+import numpy as np
+
+
+# solution values of every variable family a solver stored in model._vars
+def get_solution(model):
+    return {name: get_values(model, name) for name in model._vars}
+
+
+# solution values of one variable family with one bulk attribute query
+# integer indexed families become arrays with the index shape of the model, other families stay dicts
+def get_values(model, name):
+    var = model._vars[name]
+
+    # matrix variables already have their shape
+    if isinstance(var, gp.MVar):
+        return var.X
+
+    values = model.getAttr('X', var)
+    keys = list(values.keys())
+    if not all(isinstance(k, int) or (isinstance(k, tuple) and all(isinstance(i, int) for i in k)) for k in keys):
+        return dict(values)
+
+    # scatter the values at their indices
+    idx = np.array(keys).reshape(len(keys), -1)
+    arr = np.zeros(idx.max(axis=0) + 1)
+    arr[tuple(idx.T)] = list(values.values())
+
+    return arr
\ No newline at end of file
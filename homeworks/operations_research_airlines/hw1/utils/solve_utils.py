@@ -1,10 +1,15 @@
+from utils.instance_utils import *
+from scipy.sparse.csgraph import maximum_bipartite_matching
+import scipy.sparse as sp
 import networkx as nx
+import numpy as np
 import gurobipy as gp
 from gurobipy import GRB
+import time
 
 
 # solve max flow
-def max_flow_solver(G):
+def max_flow_solver(G, s='s', t='t'):
     # vertices
     nodes = list(G.nodes)
     # edges
@@ -12,7 +17,7 @@ def max_flow_solver(G):
     # capacities
     c = nx.get_edge_attributes(G, 'capacity')
     # vertices minus s and t
-    nodes_minus_st = [x for x in nodes if x not in ['s', 't']]
+    nodes_minus_st = [x for x in nodes if x not in [s, t]]
 
     # create model
     model = gp.Model(name="max-flow")
@@ -21,8 +26,8 @@ def max_flow_solver(G):
     x = model.addVars(edges, lb=0, name='x')
 
     # define objective function
-    delta_plus_s = list(G.successors('s'))
-    obj_fn = gp.quicksum(x['s', j] for j in delta_plus_s)
+    delta_plus_s = list(G.successors(s))
+    obj_fn = gp.quicksum(x[s, j] for j in delta_plus_s)
     model.setObjective(obj_fn, GRB.MAXIMIZE)
 
     # add constraints
@@ -30,6 +35,8 @@ def max_flow_solver(G):
     model.addConstrs((gp.quicksum(x[j, i] for j in list(G.predecessors(i))) == gp.quicksum(x[i, j] for j in list(G.successors(i)))
                       for i in nodes_minus_st), name = 'c2')
 
+    model._vars = {'x': x}
+
     # solve
     model.optimize()
 
@@ -38,7 +45,7 @@ def max_flow_solver(G):
 
 
 # solve min cut
-def min_cut_solver(G):
+def min_cut_solver(G, s='s', t='t'):
     # vertices
     nodes = list(G.nodes)
     # edges
@@ -59,8 +66,9 @@ def min_cut_solver(G):
 
     # add constraints
     model.addConstrs((u[e[0]] - u[e[1]] <= v[e] for e in edges), name = 'c1')
-    model.addConstr(u['s'] == 1, name = 'c2')
-    model.addConstr(u['t'] == 0, name = 'c3')
+    model.addConstr(u[s] == 1, name = 'c2')
+    model.addConstr(u[t] == 0, name = 'c3')
+    model._vars = {'v': v, 'u': u}
 
     # solve
     model.optimize()
@@ -70,7 +78,9 @@ def min_cut_solver(G):
 
 
 # solve min ships
-def min_ship_solver(num_of_cargoes, DD, PO, PD, sailing_time, M):
+# with lazy=True c1 is left out and incompatible pairs on a ship are cut off in a callback
+# time_limit only applies to this model, the global gurobi parameters are left untouched
+def min_ship_solver(num_of_cargoes, DD, PO, PD, sailing_time, M, lazy=False, time_limit=None):
     # variables
     S = range(num_of_cargoes)
     C = range(num_of_cargoes)
@@ -87,48 +97,156 @@ def min_ship_solver(num_of_cargoes, DD, PO, PD, sailing_time, M):
     model.setObjective(obj_fn, GRB.MINIMIZE)
 
     # add constraints
-    model.addConstrs((DD[j] - DD[i] - sailing_time[PO[i]][PD[i]] - sailing_time[PO[j]][PD[i]] >= M*(x[s, i] + x[s, j] - 2)
-                      for i in C for j in C if j > i for s in S), name='c1')
+    if lazy:
+        model.setParam(GRB.Param.LazyConstraints, 1)
+    else:
+        model.addConstrs((DD[j] - DD[i] - sailing_time[PO[i]][PD[i]] - sailing_time[PO[j]][PD[i]] >= M*(x[s, i] + x[s, j] - 2)
+                          for i in C for j in C if j > i for s in S), name='c1')
     model.addConstrs((gp.quicksum(x[s, i] for s in S) == 1 for i in C), name = 'c2')
     model.addConstrs((x[s, i] <= y[s] for i in C for s in S), name = 'c3')
 
+    model._vars = {'x': x, 'y': y}
+
     # solve
-    model.optimize()
+    model._num_lazy_cuts = 0
+    x_vars = [[x[s, i] for i in C] for s in S]
+    if time_limit is not None:
+        model.Params.TimeLimit = time_limit
+    model.optimize(_conflict_callback(x_vars, get_conflict_matrix(num_of_cargoes, DD, PO, PD, sailing_time)) if lazy else None)
 
     # return model
     return model
 
 
+# solve min ships as a minimum path cover of the compatibility DAG with Hopcroft-Karp matching
+# every matched pair (i, j) puts j right after i on a ship, so ships = cargoes - matching size
+# the MIP asks all cargoes of a ship to be pairwise compatible, both agree when sailing times satisfy the triangle inequality
+# a precomputed compatibility matrix, as stored in the cargo instances, skips its computation
+def min_ship_matching_solver(num_of_cargoes, DD, PO, PD, sailing_time, compatibility=None):
+    if compatibility is None:
+        compatibility = get_compatibility_matrix(num_of_cargoes, DD, PO, PD, sailing_time)
+    A = sp.csr_matrix(compatibility)
+
+    # successor of every cargo in the matching, -1 for the last cargo of a ship
+    successor = maximum_bipartite_matching(A, perm_type='column')
+    has_predecessor = np.zeros(num_of_cargoes, dtype=bool)
+    has_predecessor[successor[successor >= 0]] = True
+    starts = np.flatnonzero(~has_predecessor)
+
+    # same x[s, i] and y[s] structure as the MIP, ship s follows the path from its first cargo
+    x = np.zeros((num_of_cargoes, num_of_cargoes))
+    y = np.zeros(num_of_cargoes)
+    y[:len(starts)] = 1
+    successor = successor.tolist()
+    for s, i in enumerate(starts.tolist()):
+        while i >= 0:
+            x[s, i] = 1
+            i = successor[i]
+
+    return len(starts), x, y
+
+
 # solve min total travel time
-def min_total_travel_time_solver(num_of_cargoes, DD, PO, PD, sailing_time, M):
+# the model is built from sparse coefficient matrices over index arrays, z only exists for pairs i < j
+# q[s, k] = x[s, 0] + ... + x[s, k] turns the range sums of c3 and c4 into two coefficients
+# with lazy=True c1 is left out and incompatible pairs on a ship are cut off in a callback
+# time_limit only applies to this model, the global gurobi parameters are left untouched
+def min_total_travel_time_solver(num_of_cargoes, DD, PO, PD, sailing_time, M, lazy=False, time_limit=None):
+    start_time = time.perf_counter()
+
     # variables
-    S = range(num_of_cargoes)
-    C = range(num_of_cargoes)
+    S = C = num_of_cargoes
+    I, J = np.triu_indices(C, 1)
+    P = len(I)
 
     # create model
-    model = gp.Model(name="min-ships")
+    model = gp.Model(name="min-total-travel-time")
 
-    # set variables
-    x = model.addVars(S, C, vtype=GRB.BINARY, name='x')
-    z = model.addVars(S, C, C, vtype=GRB.BINARY, name='z')
-    w = model.addVars(S, C, vtype=GRB.BINARY, name='w')
+    # set variables, ship s only takes cargoes i >= s to break the symmetry between identical ships
+    x = model.addMVar((S, C), vtype=GRB.BINARY, ub=np.triu(np.ones((S, C))), name='x')
+    z = model.addMVar((S, P), vtype=GRB.BINARY, name='z')
+    w = model.addMVar((S, C), vtype=GRB.BINARY, name='w')
+    q = model.addMVar((S, C), lb=0, name='q')
+    x_flat, z_flat, w_flat, q_flat = x.reshape(-1), z.reshape(-1), w.reshape(-1), q.reshape(-1)
 
     # define objective function
-    # obj_fn = gp.quicksum(sailing_time[PO[j]][PD[i]] * z[s, i, j] for s in S for i in C for j in C if j > i)
-    obj_fn = gp.quicksum(sailing_time[PO[j]][PD[i]] * z[s, i, j] for s in S for i in C for j in C if j > i) + gp.quicksum(sailing_time['Y'][PD[i]] * w[s, i] for s in S for i in C) + 21
-    model.setObjective(obj_fn, GRB.MINIMIZE)
-
-    # add constraints
-    model.addConstrs((DD[j] - DD[i] - sailing_time[PO[i]][PD[i]] - sailing_time[PO[j]][PD[i]] >= M*(x[s, i] + x[s, j] - 2)
-                      for i in C for j in C if j > i for s in S), name='c1')
-    model.addConstrs((gp.quicksum(x[s, i] for s in S) == 1 for i in C), name = 'c2')
-    model.addConstrs((x[s, i] + x[s, j] - 1 - gp.quicksum(x[s, k] for k in C if i < k < j) <= z[s, i, j]
-                      for i in C for j in C if j > i for s in S), name = 'c3')
-    model.addConstrs((x[s, i] - gp.quicksum(x[s, k] for k in C if k > i) <= w[s, i]
-                      for i in C for s in S), name = 'c4')
+    empty_trip = np.array([sailing_time[PO[j]][PD[i]] for i, j in zip(I.tolist(), J.tolist())])
+    return_trip = np.array([sailing_time['Y'][PD[i]] for i in range(C)])
+    model.setObjective((z * empty_trip).sum() + (w * return_trip).sum() + 21, GRB.MINIMIZE)
+
+    # add constraints, c1 only where the pair is incompatible since the others hold for any binary x
+    slack = get_compatibility_slack(num_of_cargoes, DD, PO, PD, sailing_time)[I, J]
+    conflict = slack < 0
+    if lazy:
+        model.setParam(GRB.Param.LazyConstraints, 1)
+    elif conflict.any():
+        s_idx = np.repeat(np.arange(S), conflict.sum())
+        Ic, Jc = np.tile(I[conflict], S), np.tile(J[conflict], S)
+        A1 = _sparse_rows([s_idx * C + Ic, s_idx * C + Jc], [M, M], S * C)
+        model.addConstr(A1 @ x_flat <= 2 * M + np.tile(slack[conflict], S), name='c1')
+    model.addConstr(x.sum(axis=0) == 1, name='c2')
+
+    # c3: x[s, i] + x[s, j] - (q[s, j - 1] - q[s, i]) - 1 <= z[s, i, j]
+    s_idx = np.repeat(np.arange(S), P)
+    Is, Js = np.tile(I, S), np.tile(J, S)
+    Ax = _sparse_rows([s_idx * C + Is, s_idx * C + Js], [1, 1], S * C)
+    Aq = _sparse_rows([s_idx * C + Is, s_idx * C + Js - 1], [1, -1], S * C)
+    model.addConstr(Ax @ x_flat + Aq @ q_flat - z_flat <= 1, name='c3')
+
+    # c4: x[s, i] - (q[s, C - 1] - q[s, i]) <= w[s, i]
+    model.addConstr(x + q - q[:, [C - 1]] - w <= 0, name='c4')
+
+    # prefix sums of the assignments of every ship
+    model.addConstr(q[:, 0] == x[:, 0], name='q0')
+    model.addConstr(q[:, 1:] - q[:, :-1] - x[:, 1:] == 0, name='q')
+
+    model._build_time = time.perf_counter() - start_time
+    model._vars = {'x': x, 'z': z, 'w': w}
 
     # solve
-    model.optimize()
+    model._num_lazy_cuts = 0
+    conflicts = np.zeros((C, C), dtype=bool)
+    conflicts[I[conflict], J[conflict]] = True
+    if time_limit is not None:
+        model.Params.TimeLimit = time_limit
+    model.optimize(_conflict_callback(x.tolist(), conflicts) if lazy else None)
 
     # return model
-    return model
\ No newline at end of file
+    return model
+
+
+# callback adding x[s, i] + x[s, j] <= 1 on every ship for the conflicting pairs of an integer solution
+# x_vars holds the variables of ship s in row s, conflicts is the upper triangular conflict matrix
+def _conflict_callback(x_vars, conflicts):
+    flat_vars = [var for row in x_vars for var in row]
+    num_ships = len(x_vars)
+
+    def callback(model, where):
+        if where != GRB.Callback.MIPSOL: return
+
+        assigned = np.array(model.cbGetSolution(flat_vars)).reshape(num_ships, -1) > 0.5
+        # conflicting pairs among the cargoes of every ship
+        pairs = set()
+        for s in np.flatnonzero(assigned.sum(axis=1) > 1).tolist():
+            cargoes = np.flatnonzero(assigned[s])
+            I, J = np.nonzero(conflicts[np.ix_(cargoes, cargoes)])
+            pairs.update(zip(cargoes[I].tolist(), cargoes[J].tolist()))
+
+        # identical ships share the cut
+        for i, j in pairs:
+            for row in x_vars:
+                model.cbLazy(row[i] + row[j] <= 1)
+        model._num_lazy_cuts += len(pairs) * num_ships
+
+    return callback
+
+
+# sparse matrix whose row r has coefficient coefs[k] in column cols[k][r], repeated columns add up
+def _sparse_rows(cols, coefs, num_cols):
+    num_rows = len(cols[0])
+    rows = np.tile(np.arange(num_rows), len(cols))
+    data = np.repeat(np.array(coefs, dtype=float), num_rows)
+    A = sp.csr_matrix((data, (rows, np.concatenate(cols))), shape=(num_rows, num_cols))
+    A.eliminate_zeros()
+
+    return A
\ No newline at end of file
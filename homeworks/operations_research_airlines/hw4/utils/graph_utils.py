@@ -1,32 +1,89 @@
 import networkx as nx
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from scipy.sparse.csgraph import shortest_path
+import numpy as np
 
 
-def show_graphs(graphs, plot_flag=True):
+def get_layout(graphs, layout_limit=1000, seed=0):
     """
-    Plot graphs in a list of graphs
+    Return one node layout shared by all graphs
+    Spring layout up to layout_limit nodes, pivot MDS layout in O(num_pivots * m) above it
+    """
+    U = nx.compose_all(graphs)
+
+    if U.number_of_nodes() <= layout_limit:
+        return nx.spring_layout(U, seed=seed)
+
+    return _pivot_mds_layout(U, seed=seed)
+
+
+def _pivot_mds_layout(G, num_pivots=50, seed=None):
+    """
+    Return layout from classical scaling of the hop distances to max-min spaced pivot nodes
+    """
+    nodes = list(G.nodes)
+    A = nx.to_scipy_sparse_array(G, nodelist=nodes, weight=None, format='csr')
+    rng = np.random.default_rng(seed)
+
+    # Every next pivot is the node farthest from the pivots chosen so far
+    pivots = [int(rng.integers(len(nodes)))]
+    D = np.empty((len(nodes), min(num_pivots, len(nodes))))
+    for k in range(D.shape[1]):
+        D[:, k] = shortest_path(A, unweighted=True, indices=pivots[-1])
+        finite = np.isfinite(D[:, k])
+        D[~finite, k] = D[finite, k].max() + 1
+        pivots.append(int(np.argmax(D[:, :k + 1].min(axis=1))))
+
+    # Double centering of the squared distances, coordinates from the two leading singular vectors
+    C = D ** 2
+    C = -0.5 * (C - C.mean(axis=0) - C.mean(axis=1, keepdims=True) + C.mean())
+    U, S, _ = np.linalg.svd(C, full_matrices=False)
+    pos = nx.rescale_layout(U[:, :2] * S[:2])
+
+    return dict(zip(nodes, pos))
+
+
+def show_graphs(graphs, plot_flag=True, titles=None, path=None, pos=None, layout_limit=1000):
+    """
+    Plot graphs in a list of graphs with a shared layout
+    Graphs above layout_limit nodes are drawn without labels as thin translucent edges
+    With a path the figure is written to a PNG/SVG file through a headless canvas instead of shown
     """
     if not plot_flag: return
 
     # Number of graphs
     num_graphs = len(graphs)
+    titles = titles or [f"Graph {i + 1}" for i in range(num_graphs)]
 
-    # Create subplots
-    _, axes = plt.subplots(1, num_graphs, figsize=(5 * num_graphs, 5))
+    # Create subplots, a standalone figure does not need a display
+    if path is None:
+        fig, axes = plt.subplots(1, num_graphs, figsize=(5 * num_graphs, 5), squeeze=False)
+    else:
+        fig = Figure(figsize=(5 * num_graphs, 5))
+        axes = fig.subplots(1, num_graphs, squeeze=False)
 
-    # If there's only one graph, axes will not be an array, so we wrap it in a list
-    if num_graphs == 1:
-        axes = [axes]
+    # Compute the layout once for all graphs
+    if pos is None:
+        pos = get_layout(graphs, layout_limit)
+    large = len(pos) > layout_limit
 
     # Iterate over the graphs and draw them
-    for i, G in enumerate(graphs):
-        # Get position for every graph
-        pos = nx.spring_layout(G)
+    for ax, G, title in zip(axes[0], graphs, titles):
+        if large:
+            nx.draw_networkx_edges(G, pos, edge_color='gray', width=0.2, alpha=0.3, ax=ax)
+            nx.draw_networkx_nodes(G, pos, node_color='lightblue', node_size=1, ax=ax)
+            ax.set_axis_off()
+        else:
+            # Draw graph
+            nx.draw(G, pos, with_labels=True, node_color='lightblue', edge_color='gray', node_size=500, width=2, ax=ax)
+
+        ax.set_title(title)
 
-        # Draw graph
-        nx.draw(G, pos, with_labels=True, node_color='lightblue', edge_color='gray', node_size=500, width=2, ax=axes[i])
-        axes[i].set_title(f"Graph {i + 1}")
+    fig.tight_layout()
 
-    # Show figure
-    plt.tight_layout()
-    plt.show()
\ No newline at end of file
+    # Show or save figure
+    if path is None:
+        plt.show()
+    else:
+        fig.savefig(path)
\ No newline at end of file
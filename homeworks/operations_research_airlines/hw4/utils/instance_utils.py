@@ -1,26 +1,26 @@
 import networkx as nx
 import numpy as np
-import random
 
 
-def network_generator(n, m):
+def network_generator(n, m, seed=None):
     """
     Return random graph
     """
-    # create complete graph
-    G = nx.complete_graph(n)
-    
-    edges = list(G.edges())
-    random.shuffle(edges)
-    
-    # removes valid edges
-    while G.number_of_edges() > m:
-        u, v = edges.pop()
-        G.remove_edge(u, v)
-
-        # make sure edge is valid
-        if not nx.is_connected(G) or any(d == 1 for _, d in G.degree()):
-            G.add_edge(u, v)
+    if n < 3 or m < n or m > n * (n - 1) // 2:
+        raise ValueError("wrong number of edges.")
+
+    rng = np.random.default_rng(seed)
+
+    # Random Hamiltonian cycle keeps the graph connected with minimum degree 2
+    perm = rng.permutation(n)
+    keys = _edge_keys(perm, np.roll(perm, -1), n)
+
+    # Add the remaining edges among the missing pairs
+    keys = np.concatenate([keys, _random_extra_keys(n, m - n, keys, rng)])
+
+    G = nx.Graph()
+    G.add_nodes_from(range(n))
+    G.add_edges_from(zip((keys // n).tolist(), (keys % n).tolist()))
 
     # rename s and t vertices
     G = nx.relabel_nodes(G, {0: 't'})
@@ -28,11 +28,45 @@ def network_generator(n, m):
     return G
 
 
-def get_random_graphs(n, m, num_graphs):
+def get_random_graphs(n, m, num_graphs, seed=None):
     """
     Return list of random graphs
     """
-    return [network_generator(n, m) for _ in range(num_graphs)]
+    rng = np.random.default_rng(seed)
+    return [network_generator(n, m, rng) for _ in range(num_graphs)]
+
+
+def _edge_keys(u, v, n):
+    """
+    Return unique integer key of every undirected edge
+    """
+    return np.minimum(u, v).astype(np.int64) * n + np.maximum(u, v)
+
+
+def _random_extra_keys(n, k, keys, rng):
+    """
+    Return k distinct random edge keys not in keys
+    """
+    if k == 0: return np.empty(0, dtype=np.int64)
+
+    # Dense graphs: sample directly among all missing pairs
+    if 2 * (len(keys) + k) > n * (n - 1) // 2:
+        i, j = np.triu_indices(n, 1)
+        free = i * n + j
+        return rng.choice(free[~np.isin(free, keys)], k, replace=False)
+
+    # Sparse graphs: draw random pairs until there are enough new ones
+    extra = np.empty(0, dtype=np.int64)
+    while len(extra) < k:
+        size = 2 * (k - len(extra)) + 16
+        a, b = rng.integers(0, n, size), rng.integers(0, n, size)
+        extra = np.sort(np.concatenate([extra, _edge_keys(a[a != b], b[a != b], n)]))
+
+        # Drop duplicates and existing edges with a sort-based pass
+        extra = extra[np.r_[True, extra[1:] != extra[:-1]]]
+        extra = extra[~np.isin(extra, keys)]
+
+    return rng.choice(extra, k, replace=False)
 
 
 def create_grid_world():
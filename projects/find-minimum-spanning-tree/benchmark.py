@@ -0,0 +1,61 @@
+from utils.benchmark_utils import *
+
+
+# Set parameter flags
+flags = {
+    'setup_time': True,
+    'separation': True,
+    'mip_start': True,
+    'formulations': True,
+    'engines': True,
+    'external': True,
+    'dynamic': True,
+    'analysis': True,
+    'grid': True,
+    'output': 'benchmark_results'
+}
+
+
+def main():
+    # Model setup time as the number of nodes grows
+    if flags['setup_time']:
+        print_results(benchmark_setup_time(sizes=[10, 20, 100, 500, 1000, 2000, 5000]))
+
+    # Subtour separation statistics of the MIP
+    if flags['separation']:
+        print_results(benchmark_separation(sizes=[20, 50, 100]))
+
+    # Time to first incumbent with and without MIP start
+    if flags['mip_start']:
+        print_results(benchmark_mip_start(sizes=[20, 50, 100]))
+
+    # Compact formulations against the subtour formulation
+    if flags['formulations']:
+        print_results(benchmark_formulations(sizes=[10, 15, 20]))
+
+    # Combinatorial engines on large edge lists
+    if flags['engines']:
+        print_results(benchmark_engines(sizes=[10**4, 10**5, 10**6]))
+
+    # Out-of-core pipeline over binary edge files
+    if flags['external']:
+        print_results(benchmark_external(sizes=[10**4, 10**5, 10**6]))
+
+    # Incremental tree maintenance against full recomputation
+    if flags['dynamic']:
+        print_results(benchmark_dynamic(sizes=[10**3, 10**4, 10**5]))
+
+    # Sensitivity ranges and k best trees on graphs of 10^5 edges
+    if flags['analysis']:
+        print_results(benchmark_analysis(sizes=[10**4, 10**5]))
+
+    # Engine sweep over sizes, degrees and seeds, saved to track regressions between versions
+    if flags['grid']:
+        results = benchmark_grid(sizes=[10, 50, 100, 1000, 10000], degrees=[4, 10], seeds=[0, 1, 2])
+        print_results(results)
+        write_results(results, f"{flags['output']}.csv")
+        write_results(results, f"{flags['output']}.json")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,221 @@
+from classes.LinkCutTree import *
+from utils.engine_utils import *
+import networkx as nx
+
+
+class DynamicMST:
+    """
+    Minimum spanning forest maintained under edge insertions, deletions and weight changes
+    Insertions and decreases use cycle property checks with link-cut path-max queries in O(log n),
+    deletions and increases search the smaller side of the cut for the cheapest replacement edge
+    """
+    def __init__(self, G):
+        self.nodes = []
+        self.index = {}
+        self.lct = LinkCutTree()
+        self.vertex_node = []
+
+        # Edge weights keyed by sorted index pairs, link-cut node of every tree edge and its inverse
+        self.weight = {}
+        self.edge_node = {}
+        self.node_edge = {}
+
+        # Tree and non-tree adjacency of every node
+        self.tree_adj = []
+        self.non_tree_adj = []
+
+        for v in G.nodes:
+            self._add_vertex(v)
+
+        # Initial tree from Kruskal's algorithm
+        nodes, u, v, w = get_edge_arrays(G)
+        in_tree = np.zeros(len(w), dtype=bool)
+        in_tree[kruskal_edge_indices(len(nodes), u, v, w)] = True
+        for i, j, c, t in zip(u.tolist(), v.tolist(), w.tolist(), in_tree.tolist()):
+            key = _key(i, j)
+            self.weight[key] = c
+            if t:
+                self._link(key)
+            else:
+                self._add_non_tree(key)
+
+
+    def _add_vertex(self, v):
+        self.index[v] = len(self.nodes)
+        self.nodes.append(v)
+        self.vertex_node.append(self.lct.add_node())
+        self.tree_adj.append(set())
+        self.non_tree_adj.append(set())
+
+
+    def _indices(self, u, v):
+        for x in (u, v):
+            if x not in self.index:
+                self._add_vertex(x)
+        return _key(self.index[u], self.index[v])
+
+
+    def _link(self, key):
+        i, j = key
+        e = self.lct.add_node(self.weight[key])
+        self.lct.link(self.vertex_node[i], e)
+        self.lct.link(e, self.vertex_node[j])
+        self.edge_node[key] = e
+        self.node_edge[e] = key
+        self.tree_adj[i].add(j)
+        self.tree_adj[j].add(i)
+
+
+    def _cut(self, key):
+        i, j = key
+        e = self.edge_node.pop(key)
+        del self.node_edge[e]
+        self.lct.cut(self.vertex_node[i], e)
+        self.lct.cut(e, self.vertex_node[j])
+        self.lct.remove_node(e)
+        self.tree_adj[i].discard(j)
+        self.tree_adj[j].discard(i)
+
+
+    def _add_non_tree(self, key):
+        i, j = key
+        self.non_tree_adj[i].add(j)
+        self.non_tree_adj[j].add(i)
+
+
+    def _remove_non_tree(self, key):
+        i, j = key
+        self.non_tree_adj[i].discard(j)
+        self.non_tree_adj[j].discard(i)
+
+
+    def _try_swap_in(self, key):
+        """
+        Cycle property: make a non-tree edge a tree edge if it is lighter than the heaviest edge on its tree path
+        """
+        i, j = self.vertex_node[key[0]], self.vertex_node[key[1]]
+        if not self.lct.connected(i, j):
+            self._remove_non_tree(key)
+            self._link(key)
+            return
+
+        # Heaviest tree edge on the cycle closed by key
+        e = self.lct.path_max(i, j)
+        if self.lct.val[e] <= self.weight[key]: return
+
+        heaviest = self.node_edge[e]
+        self._cut(heaviest)
+        self._add_non_tree(heaviest)
+        self._remove_non_tree(key)
+        self._link(key)
+
+
+    def _reconnect(self, i, j):
+        """
+        Cut property: reconnect the two sides of a removed tree edge with the cheapest crossing non-tree edge
+        """
+        side = self._smaller_side(i, j)
+
+        best = None
+        for a in side:
+            for b in self.non_tree_adj[a]:
+                if b in side: continue
+                key = _key(a, b)
+                if best is None or self.weight[key] < self.weight[best]:
+                    best = key
+
+        if best is not None:
+            self._remove_non_tree(best)
+            self._link(best)
+
+
+    def _smaller_side(self, i, j):
+        """
+        Return the nodes of the smaller tree among those of i and j, searching both alternately
+        """
+        seen = [{i}, {j}]
+        frontier = [[i], [j]]
+        while frontier[0] and frontier[1]:
+            for s in (0, 1):
+                x = frontier[s].pop()
+                for y in self.tree_adj[x]:
+                    if y not in seen[s]:
+                        seen[s].add(y)
+                        frontier[s].append(y)
+                if not frontier[s]:
+                    return seen[s]
+
+        return seen[0] if not frontier[0] else seen[1]
+
+
+    def insert_edge(self, u, v, weight):
+        """
+        Add edge (u, v), or update its weight if it exists
+        """
+        key = self._indices(u, v)
+        if key in self.weight:
+            self.update_weight(u, v, weight)
+            return
+
+        self.weight[key] = weight
+        self._add_non_tree(key)
+        self._try_swap_in(key)
+
+
+    def delete_edge(self, u, v):
+        """
+        Remove edge (u, v)
+        """
+        key = self._indices(u, v)
+        self.weight.pop(key)
+
+        if key not in self.edge_node:
+            self._remove_non_tree(key)
+            return
+
+        self._cut(key)
+        self._reconnect(*key)
+
+
+    def update_weight(self, u, v, weight):
+        """
+        Change the weight of edge (u, v)
+        """
+        key = self._indices(u, v)
+        old = self.weight[key]
+        self.weight[key] = weight
+
+        if key not in self.edge_node:
+            # Only a cheaper non-tree edge can enter the tree
+            if weight < old:
+                self._try_swap_in(key)
+            return
+
+        self.lct.set_value(self.edge_node[key], weight)
+
+        # Only a more expensive tree edge can leave the tree, it competes with the other crossing edges
+        if weight > old:
+            self._cut(key)
+            self._add_non_tree(key)
+            self._reconnect(*key)
+
+
+    def tree_weight(self):
+        """
+        Return total weight of the maintained tree
+        """
+        return sum(self.weight[key] for key in self.edge_node)
+
+
+    def get_tree(self):
+        """
+        Return Tree graph
+        """
+        T = nx.Graph()
+        T.add_weighted_edges_from((self.nodes[i], self.nodes[j], self.weight[(i, j)]) for i, j in self.edge_node)
+
+        return T
+
+
+def _key(i, j):
+    return (i, j) if i < j else (j, i)
\ No newline at end of file
@@ -0,0 +1,180 @@
+class LinkCutTree:
+    """
+    Link-cut tree over a forest of valued nodes, paths report the node with the largest value
+    """
+    def __init__(self):
+        self.left = []
+        self.right = []
+        self.parent = []
+        self.flip = []
+        self.val = []
+        self.best = []
+        self.free = []
+
+
+    def add_node(self, val=float('-inf')):
+        """
+        Add an isolated node and return its id
+        """
+        if self.free:
+            x = self.free.pop()
+            self.left[x] = self.right[x] = self.parent[x] = -1
+            self.flip[x] = False
+            self.val[x] = val
+            self.best[x] = x
+            return x
+
+        for arr, init in ((self.left, -1), (self.right, -1), (self.parent, -1), (self.flip, False), (self.val, val)):
+            arr.append(init)
+        self.best.append(len(self.best))
+
+        return len(self.best) - 1
+
+
+    def remove_node(self, x):
+        """
+        Release an isolated node id for reuse
+        """
+        self.free.append(x)
+
+
+    def _is_root(self, x):
+        p = self.parent[x]
+        return p == -1 or (self.left[p] != x and self.right[p] != x)
+
+
+    def _push(self, x):
+        if not self.flip[x]: return
+
+        l, r = self.left[x], self.right[x]
+        self.left[x], self.right[x] = r, l
+        if l != -1: self.flip[l] = not self.flip[l]
+        if r != -1: self.flip[r] = not self.flip[r]
+        self.flip[x] = False
+
+
+    def _pull(self, x):
+        b = x
+        for c in (self.left[x], self.right[x]):
+            if c != -1 and self.val[self.best[c]] > self.val[b]:
+                b = self.best[c]
+        self.best[x] = b
+
+
+    def _rotate(self, x):
+        p = self.parent[x]
+        g = self.parent[p]
+
+        # Replace p by x under g, unless p hangs from a path-parent pointer
+        if not self._is_root(p):
+            if self.left[g] == p:
+                self.left[g] = x
+            else:
+                self.right[g] = x
+        self.parent[x] = g
+
+        if self.left[p] == x:
+            c = self.right[x]
+            self.left[p], self.right[x] = c, p
+        else:
+            c = self.left[x]
+            self.right[p], self.left[x] = c, p
+        if c != -1:
+            self.parent[c] = p
+        self.parent[p] = x
+
+        self._pull(p)
+        self._pull(x)
+
+
+    def _splay(self, x):
+        # Push pending flips from the splay tree root down to x
+        path = [x]
+        while not self._is_root(path[-1]):
+            path.append(self.parent[path[-1]])
+        for y in reversed(path):
+            self._push(y)
+
+        while not self._is_root(x):
+            p = self.parent[x]
+            if not self._is_root(p):
+                g = self.parent[p]
+                self._rotate(p if (self.left[g] == p) == (self.left[p] == x) else x)
+            self._rotate(x)
+
+
+    def _access(self, x):
+        last, y = -1, x
+        while y != -1:
+            self._splay(y)
+            self.right[y] = last
+            self._pull(y)
+            last, y = y, self.parent[y]
+        self._splay(x)
+
+
+    def make_root(self, x):
+        """
+        Make x the root of its tree
+        """
+        self._access(x)
+        self.flip[x] = not self.flip[x]
+
+
+    def find_root(self, x):
+        """
+        Return the root of the tree containing x
+        """
+        self._access(x)
+        while True:
+            self._push(x)
+            if self.left[x] == -1: break
+            x = self.left[x]
+        self._splay(x)
+
+        return x
+
+
+    def connected(self, x, y):
+        """
+        Return True if x and y are in the same tree
+        """
+        return x == y or self.find_root(x) == self.find_root(y)
+
+
+    def link(self, x, y):
+        """
+        Add an edge between x and y, which must be in different trees
+        """
+        self.make_root(x)
+        self.parent[x] = y
+
+
+    def cut(self, x, y):
+        """
+        Remove the edge between adjacent nodes x and y
+        """
+        self.make_root(x)
+        self._access(y)
+        self.left[y] = -1
+        self.parent[x] = -1
+        self._pull(y)
+
+
+    def path_max(self, x, y):
+        """
+        Return the node with the largest value on the path between x and y
+        """
+        self.make_root(x)
+        self._access(y)
+
+        return self.best[y]
+
+
+    def set_value(self, x, val):
+        """
+        Change the value of node x
+        """
+        self._splay(x)
+        self.val[x] = val
+        self._pull(x)
\ No newline at end of file
@@ -0,0 +1,51 @@
+class UnionFind:
+    """
+    Array-backed disjoint set forest with path compression and union by rank
+    """
+    def __init__(self, n):
+        self.parent = list(range(n))
+        self.rank = [0] * n
+        self.num_sets = n
+
+
+    def find(self, i):
+        """
+        Return the representative of the set containing i
+        """
+        parent = self.parent
+
+        # Find root
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+
+        # Compress path
+        while parent[i] != root:
+            parent[i], i = root, parent[i]
+
+        return root
+
+
+    def union(self, i, j):
+        """
+        Merge the sets containing i and j, return False if they were already merged
+        """
+        ri, rj = self.find(i), self.find(j)
+        if ri == rj: return False
+
+        # Attach shorter tree under the taller one
+        if self.rank[ri] < self.rank[rj]:
+            ri, rj = rj, ri
+        self.parent[rj] = ri
+        if self.rank[ri] == self.rank[rj]:
+            self.rank[ri] += 1
+
+        self.num_sets -= 1
+        return True
+
+
+    def labels(self):
+        """
+        Return the representative of every element
+        """
+        return [self.find(i) for i in range(len(self.parent))]
\ No newline at end of file
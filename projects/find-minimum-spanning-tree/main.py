@@ -1,10 +1,13 @@
 from utils.graph_utils import *
 from utils.solve_utils import *
+from utils.analysis_utils import *
 
 
 # Set parameter flags
 flags = {
-    'plot': True
+    'plot': True,
+    'engine': 'mip',
+    'analysis': True
 }
 
 
@@ -13,12 +16,24 @@ def main():
     G = network_generator(n=8, m=13)
 
     # Solve minimum spanning tree
-    H = solve_minimum_spanning_tree(G)
+    H = MST_ENGINES[flags['engine']](G)
 
     T = nx.minimum_spanning_tree(G)
 
+    # Cross-check against networkx
+    print(
+        f"{flags['engine']} weight: {tree_weight(H)}, nx weight: {tree_weight(T)}, "
+        f"match: {check_minimum_spanning_tree(H, T)}"
+    )
+
+    # Weight ranges keeping the tree optimal and next cheapest trees
+    if flags['analysis']:
+        for e, (low, high) in edge_sensitivity(G, H).items():
+            print(f"edge {e}: weight {G.edges[e]['weight']}, range [{low}, {high}]")
+        print(f"5 best tree weights: {[K.graph['weight'] for K in k_best_spanning_trees(G, 5, H)]}")
+
     # Show graphs
-    show_graphs([G, H, T], flags['plot'])
+    show_graphs([G, H, T], flags['plot'], titles=["Graph", "Minimum Spanning Tree", "NX Minimum Spanning Tree"])
 
 
 if __name__ == "__main__":
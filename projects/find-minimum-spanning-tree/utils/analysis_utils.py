@@ -0,0 +1,216 @@
+from utils.engine_utils import *
+from scipy.sparse.csgraph import breadth_first_order, connected_components
+import scipy.sparse as sp
+import networkx as nx
+import numpy as np
+import itertools
+import heapq
+
+
+def edge_sensitivity(G, T=None):
+    """
+    Return for every edge the range of its weight over which the tree stays a minimum spanning tree
+    A tree edge may rise up to the lightest non-tree edge whose cycle contains it (cut property),
+    a non-tree edge may drop down to the heaviest tree edge on its tree path (cycle property)
+    """
+    nodes, u, v, w = get_edge_arrays(G)
+    n = len(nodes)
+    in_tree = _tree_mask(T, nodes, u, v, w)
+    tree, other = np.flatnonzero(in_tree), np.flatnonzero(~in_tree)
+
+    # Path maximum and lowest common ancestor of every non-tree edge
+    lift = _lift_tree(n, u[tree], v[tree], w[tree])
+    path_max, _, lca = _path_max(lift, u[other], v[other])
+
+    # Lightest covering non-tree edge of every tree edge, stored at its lower endpoint
+    cover = _path_min_cover(lift, u[other], v[other], lca, w[other])
+
+    # Move the cover of every non-root node to the tree edge above it
+    below = np.flatnonzero(lift[1][0] != np.arange(n))
+    low, high = np.full(len(w), -np.inf), np.full(len(w), np.inf)
+    high[tree[lift[4][below]]] = cover[below]
+    low[other] = path_max
+
+    return {e: (a, b) for e, a, b in zip(G.edges, low.tolist(), high.tolist())}
+
+
+def k_best_spanning_trees(G, k, T=None):
+    """
+    Lawler partitioning of the spanning trees: every subspace of trees with forced and forbidden edges
+    has its best tree output already and its second best one edge swap away
+    Return the k cheapest spanning trees as Tree graphs, starting with T
+    """
+    nodes, u, v, w = get_edge_arrays(G)
+    n, m = len(nodes), len(w)
+    counter = itertools.count()
+    heap = []
+
+    def push(tree, included, excluded, weight):
+        swap = _best_swap(n, u, v, w, tree, included, excluded)
+        if swap is not None:
+            f, e, delta = swap
+            heapq.heappush(heap, (weight + delta, next(counter), tree, included, excluded, f, e))
+
+    tree = np.flatnonzero(_tree_mask(T, nodes, u, v, w))
+    trees = [(tree, w[tree].sum())]
+    push(tree, np.zeros(m, dtype=bool), np.zeros(m, dtype=bool), trees[0][1])
+
+    while len(trees) < k and heap:
+        weight, _, tree, included, excluded, f, e = heapq.heappop(heap)
+        new_tree = np.r_[tree[tree != e], f]
+        trees.append((new_tree, weight))
+
+        # Trees with e keep the old best tree, trees without e have the new one as best
+        with_e, without_e = included.copy(), excluded.copy()
+        with_e[e] = without_e[e] = True
+        push(tree, with_e, excluded, w[tree].sum())
+        push(new_tree, included, without_e, weight)
+
+    results = []
+    for tree, weight in trees:
+        H = nx.Graph(weight=float(weight))
+        H.add_weighted_edges_from(zip([nodes[i] for i in u[tree].tolist()], [nodes[i] for i in v[tree].tolist()], w[tree].tolist()))
+        results.append(H)
+
+    return results
+
+
+def _best_swap(n, u, v, w, tree, included, excluded):
+    """
+    Return the non-tree edge, the removed tree edge and the weight change of the cheapest single swap
+    """
+    in_tree = np.zeros(len(w), dtype=bool)
+    in_tree[tree] = True
+    other = np.flatnonzero(~in_tree & ~excluded)
+    if not len(other): return None
+
+    # Forced edges can never leave the tree
+    tw = w[tree].copy()
+    tw[included[tree]] = -np.inf
+
+    path_max, arg, _ = _path_max(_lift_tree(n, u[tree], v[tree], tw), u[other], v[other])
+    delta = np.where(arg >= 0, w[other] - path_max, np.inf)
+    j = np.argmin(delta)
+    if not np.isfinite(delta[j]): return None
+
+    return other[j], tree[arg[j]], delta[j]
+
+
+def _tree_mask(T, nodes, u, v, w):
+    """
+    Return mask of the edges of T, the Kruskal tree when T is None
+    """
+    n = len(nodes)
+    in_tree = np.zeros(len(w), dtype=bool)
+    if T is None:
+        in_tree[kruskal_edge_indices(n, u, v, w)] = True
+        return in_tree
+
+    index = {x: i for i, x in enumerate(nodes)}
+    a = np.array([index[x] for x, _ in T.edges], dtype=np.int64)
+    b = np.array([index[y] for _, y in T.edges], dtype=np.int64)
+    tree_keys = np.minimum(a, b) * n + np.maximum(a, b)
+
+    return np.isin(np.minimum(u, v) * n + np.maximum(u, v), tree_keys)
+
+
+def _lift_tree(n, tu, tv, tw):
+    """
+    Return depths, binary lifting tables of ancestors, path maxima and their tree edge indices,
+    and the tree edge above every node
+    """
+    # Root every component by breadth first search
+    A = sp.csr_matrix((np.ones(len(tu)), (tu, tv)), shape=(n, n))
+    _, labels = connected_components(A, directed=False)
+    parent = np.arange(n)
+    for root in np.unique(labels, return_index=True)[1].tolist():
+        order, pred = breadth_first_order(A, root, directed=False)
+        parent[order[1:]] = pred[order[1:]]
+
+    # Tree edge between every node and its parent, roots get a dummy edge
+    keys = np.minimum(tu, tv) * n + np.maximum(tu, tv)
+    order = np.argsort(keys)
+    nodes = np.arange(n)
+    up_keys = np.minimum(nodes, parent) * n + np.maximum(nodes, parent)
+    up_edge = order[np.minimum(np.searchsorted(keys, up_keys, sorter=order), len(keys) - 1)]
+    is_root = parent == nodes
+    up_edge[is_root] = 0
+
+    up = [parent]
+    mx = [np.where(is_root, -np.inf, tw[up_edge] if len(tw) else -np.inf)]
+    arg = [np.where(is_root, -1, up_edge)]
+    depth = (~is_root).astype(np.int64)
+
+    # Double the jumps until every node reaches its root
+    while True:
+        p = up[-1]
+        if np.all(p[p] == p): break
+        better = mx[-1][p] > mx[-1]
+        depth = depth + depth[p]
+        mx.append(np.where(better, mx[-1][p], mx[-1]))
+        arg.append(np.where(better, arg[-1][p], arg[-1]))
+        up.append(p[p])
+
+    return depth, up, mx, arg, up_edge
+
+
+def _path_max(lift, a, b):
+    """
+    Return maximum weight, its tree edge index (-1 on empty paths) and lowest common ancestor of every node pair
+    """
+    depth, up, mx, arg, _ = lift
+    a, b = a.copy(), b.copy()
+    best = np.full(len(a), -np.inf)
+    best_arg = np.full(len(a), -1, dtype=np.int64)
+
+    swap = depth[a] < depth[b]
+    a[swap], b[swap] = b[swap], a[swap]
+
+    # Lift the deeper endpoint to the depth of the other one
+    diff = depth[a] - depth[b]
+    for k in range(len(up)):
+        s = np.flatnonzero((diff >> k) & 1)
+        _update_max(best, best_arg, s, mx[k][a[s]], arg[k][a[s]])
+        a[s] = up[k][a[s]]
+
+    # Lift both endpoints while their ancestors differ
+    for k in reversed(range(len(up))):
+        s = np.flatnonzero(up[k][a] != up[k][b])
+        _update_max(best, best_arg, s, mx[k][a[s]], arg[k][a[s]])
+        _update_max(best, best_arg, s, mx[k][b[s]], arg[k][b[s]])
+        a[s], b[s] = up[k][a[s]], up[k][b[s]]
+
+    s = np.flatnonzero(a != b)
+    _update_max(best, best_arg, s, mx[0][a[s]], arg[0][a[s]])
+    _update_max(best, best_arg, s, mx[0][b[s]], arg[0][b[s]])
+
+    return best, best_arg, np.where(a != b, up[0][a], a)
+
+
+def _update_max(best, best_arg, s, vals, args):
+    better = vals > best[s]
+    best[s[better]] = vals[better]
+    best_arg[s[better]] = args[better]
+
+
+def _path_min_cover(lift, a, b, lca, vals):
+    """
+    Return for every node the smallest value among the paths covering the edge to its parent
+    """
+    depth, up, _, _, _ = lift
+    cover = [np.full(len(depth), np.inf) for _ in up]
+
+    # Split both halves of every path into power of two jumps
+    for x in (a.copy(), b.copy()):
+        diff = depth[x] - depth[lca]
+        for k in range(len(up)):
+            s = np.flatnonzero((diff >> k) & 1)
+            np.minimum.at(cover[k], x[s], vals[s])
+            x[s] = up[k][x[s]]
+
+    # Push every jump down to its two halves
+    for k in reversed(range(1, len(up))):
+        np.minimum(cover[k - 1], cover[k], out=cover[k - 1])
+        np.minimum.at(cover[k - 1], up[k - 1], cover[k])
+
+    return cover[0]
\ No newline at end of file
@@ -0,0 +1,303 @@
+from utils.graph_utils import *
+from utils.solve_utils import *
+from utils.analysis_utils import *
+from classes.DynamicMST import *
+import itertools
+import tracemalloc
+import tempfile
+import time
+import os
+
+
+def benchmark_setup_time(sizes, degree=4, repeats=3, seed=0):
+    """
+    Return MIP setup time for random graphs of growing size
+    """
+    results = []
+    for n in sizes:
+        # Sparse random graph with the given average degree
+        G = network_generator(n, degree * n // 2, seed=seed)
+
+        # Keep the best of the repeats to filter out noise
+        times = []
+        for _ in range(repeats):
+            start_time = time.perf_counter()
+            build_minimum_spanning_tree_model(G)
+            times.append(time.perf_counter() - start_time)
+
+        results.append({
+            'n': n,
+            'm': G.number_of_edges(),
+            'setup_time': min(times),
+            'setup_time_per_edge': min(times) / max(G.number_of_edges(), 1)
+        })
+
+    return results
+
+
+def benchmark_separation(sizes, degree=6, seed=0):
+    """
+    Return solve time, callback time and cut counts with and without fractional separation
+    """
+    results = []
+    for n in sizes:
+        G = network_generator(n, degree * n // 2, seed=seed)
+
+        for fractional_cuts in [False, True]:
+            T = solve_minimum_spanning_tree(G, fractional_cuts=fractional_cuts)
+            results.append({
+                'n': n,
+                'fractional_cuts': int(fractional_cuts),
+                'runtime': T.graph['runtime'],
+                'callback_time': T.graph['callback_time'],
+                'num_lazy_cuts': T.graph['num_lazy_cuts'],
+                'num_fractional_cuts': T.graph['num_fractional_cuts']
+            })
+
+    return results
+
+
+def benchmark_mip_start(sizes, degree=6, seed=0):
+    """
+    Return time to first incumbent and time to optimality for every MIP start option
+    """
+    results = []
+    for n in sizes:
+        G = network_generator(n, degree * n // 2, seed=seed)
+
+        for start in [None] + list(MIP_STARTS):
+            T = solve_minimum_spanning_tree(G, start=start, seed=seed)
+            results.append({
+                'n': n,
+                'start': str(start),
+                'first_incumbent_time': T.graph['first_incumbent_time'],
+                'optimal_time': T.graph['optimal_time']
+            })
+
+    return results
+
+
+def benchmark_formulations(sizes, degree=4, seed=0):
+    """
+    Return LP bound, setup time and solve time of every MIP formulation
+    """
+    results = []
+    for n in sizes:
+        G = network_generator(n, degree * n // 2, seed=seed)
+
+        for formulation in FORMULATIONS:
+            lp_bound, lp_time = get_lp_bound(G, formulation)
+            T = solve_minimum_spanning_tree(G, formulation=formulation)
+            results.append({
+                'n': n,
+                'formulation': formulation,
+                'lp_bound': lp_bound,
+                'lp_time': lp_time,
+                'tree_weight': tree_weight(T),
+                'setup_time': T.graph['setup_time'],
+                'runtime': T.graph['runtime']
+            })
+
+    return results
+
+
+def benchmark_engines(sizes, degree=10, workers=4, nx_limit=10**6, seed=0):
+    """
+    Return time of the array-based engines and of networkx on random graphs
+    """
+    results = []
+    for n in sizes:
+        u, v, w = random_edge_arrays(n, degree * n // 2, seed=seed)
+
+        engines = {
+            'kruskal': lambda: kruskal_edge_indices(n, u, v, w),
+            'boruvka': lambda: boruvka_edge_indices(n, u, v, w),
+            f'boruvka_{workers}_workers': lambda: boruvka_edge_indices(n, u, v, w, workers)
+        }
+        for name, engine in engines.items():
+            start_time = time.perf_counter()
+            tree = engine()
+            results.append({
+                'n': n, 'm': len(w), 'engine': name,
+                'runtime': time.perf_counter() - start_time,
+                'tree_weight': float(w[tree].sum())
+            })
+
+        # networkx needs the graph object, building it is not timed
+        if len(w) <= nx_limit:
+            G = nx.Graph()
+            G.add_weighted_edges_from(zip(u.tolist(), v.tolist(), w.tolist()))
+            start_time = time.perf_counter()
+            T = nx.minimum_spanning_tree(G)
+            results.append({
+                'n': n, 'm': len(w), 'engine': 'networkx',
+                'runtime': time.perf_counter() - start_time,
+                'tree_weight': tree_weight(T)
+            })
+
+    return results
+
+
+def benchmark_external(sizes, degree=10, chunk_size=10**6, seed=0):
+    """
+    Return time of the file-based pipeline: generate edge file, external Kruskal, tree file
+    """
+    results = []
+    for n in sizes:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path, out_path = os.path.join(tmp_dir, "graph.bin"), os.path.join(tmp_dir, "tree.bin")
+
+            start_time = time.perf_counter()
+            network_generator(n, degree * n // 2, seed=seed, path=path)
+            generate_time = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            num_edges, weight = external_kruskal(path, out_path, n, chunk_size)
+            results.append({
+                'n': n, 'm': degree * n // 2,
+                'generate_time': generate_time,
+                'runtime': time.perf_counter() - start_time,
+                'tree_edges': num_edges,
+                'tree_weight': weight
+            })
+
+    return results
+
+
+def benchmark_dynamic(sizes, degree=10, num_updates=5000, seed=0):
+    """
+    Return time per incremental update against a full recomputation, and the tree weight of both
+    """
+    results = []
+    rng = np.random.default_rng(seed)
+    for n in sizes:
+        G = network_generator(n, degree * n // 2, seed=seed)
+        D = DynamicMST(G)
+        edges = list(G.edges)
+
+        # Random weight changes, deletions and insertions
+        start_time = time.perf_counter()
+        for op, r in zip(rng.integers(0, 3, num_updates).tolist(), rng.integers(1, 11, num_updates).tolist()):
+            if op == 0:
+                D.update_weight(*edges[rng.integers(len(edges))], r)
+            elif op == 1 and len(edges) > n:
+                k = rng.integers(len(edges))
+                D.delete_edge(*edges[k])
+                edges[k] = edges[-1]
+                edges.pop()
+            else:
+                a, b = rng.integers(n, size=2).tolist()
+                if a != b and (min(a, b), max(a, b)) not in D.weight:
+                    D.insert_edge(a, b, r)
+                    edges.append((a, b))
+        update_time = (time.perf_counter() - start_time) / num_updates
+
+        # Full recomputation on the final edge set
+        start_time = time.perf_counter()
+        keys = list(D.weight)
+        u, v = (np.array(a, dtype=np.int64) for a in zip(*keys))
+        w = np.array([D.weight[k] for k in keys], dtype=float)
+        tree = kruskal_edge_indices(len(D.nodes), u, v, w)
+        recompute_time = time.perf_counter() - start_time
+
+        results.append({
+            'n': n, 'm': len(keys),
+            'update_time': update_time,
+            'recompute_time': recompute_time,
+            'dynamic_weight': D.tree_weight(),
+            'recomputed_weight': float(w[tree].sum())
+        })
+
+    return results
+
+
+def benchmark_analysis(sizes, degree=10, k=10, engine='kruskal', seed=0):
+    """
+    Return time of the sensitivity ranges and of the k best spanning trees around the tree of an engine
+    """
+    results = []
+    for m in sizes:
+        G = network_generator(2 * m // degree, m, seed=seed)
+
+        start_time = time.perf_counter()
+        T = MST_ENGINES[engine](G)
+        tree_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        edge_sensitivity(G, T)
+        sensitivity_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        trees = k_best_spanning_trees(G, k, T)
+        k_best_time = time.perf_counter() - start_time
+
+        results.append({
+            'n': G.number_of_nodes(), 'm': m,
+            'tree_time': tree_time,
+            'sensitivity_time': sensitivity_time,
+            'k_best_time': k_best_time,
+            'tree_weight': tree_weight(T),
+            'kth_weight': trees[-1].graph['weight']
+        })
+
+    return results
+
+
+def benchmark_grid(sizes, degrees, seeds, engines=None, warmups=1, repeats=3, mip_limit=100):
+    """
+    Return wall time, peak Python memory, callback statistics and agreement with networkx
+    of every engine over a grid of node counts, average degrees and seeds
+    """
+    engines = engines or ['networkx', *MST_ENGINES]
+    solvers = {'networkx': nx.minimum_spanning_tree, **MST_ENGINES}
+
+    results = []
+    for n, degree, seed in itertools.product(sizes, degrees, seeds):
+        G = network_generator(n, min(degree * n // 2, n * (n - 1) // 2), seed=seed)
+        reference = nx.minimum_spanning_tree(G)
+
+        for engine in engines:
+            # The MIP is only run on small graphs
+            if engine == 'mip' and n > mip_limit: continue
+            solve = solvers[engine]
+
+            for _ in range(warmups):
+                solve(G)
+
+            times = []
+            for _ in range(repeats):
+                start_time = time.perf_counter()
+                T = solve(G)
+                times.append(time.perf_counter() - start_time)
+
+            # Memory is traced in a separate run, tracing slows down the timed runs
+            tracemalloc.start()
+            solve(G)
+            peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            results.append({
+                'engine': engine, 'n': n, 'm': G.number_of_edges(), 'seed': seed,
+                'min_time': min(times),
+                'mean_time': sum(times) / len(times),
+                'peak_memory_mb': peak_memory / 2**20,
+                'num_lazy_cuts': T.graph.get('num_lazy_cuts'),
+                'num_fractional_cuts': T.graph.get('num_fractional_cuts'),
+                'callback_time': T.graph.get('callback_time'),
+                'tree_weight': tree_weight(T),
+                'match': check_minimum_spanning_tree(T, reference)
+            })
+
+    return results
+
+
+def print_results(results):
+    """
+    Print benchmark results as a table
+    """
+    if not results: return
+
+    keys = list(results[0])
+    print(" ".join(f"{k:>20}" for k in keys))
+    for row in results:
+        print(" ".join(f"{row[k]:>20.6g}" if isinstance(row[k], float) else f"{str(row[k]):>20}" for k in keys))
\ No newline at end of file
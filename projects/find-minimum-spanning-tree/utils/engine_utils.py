@@ -0,0 +1,398 @@
+from classes.UnionFind import *
+from utils.file_utils import *
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import networkx as nx
+import numpy as np
+import itertools
+import tempfile
+import heapq
+import time
+import os
+
+
+def get_edge_arrays(G):
+    """
+    Return node list and edge endpoint/weight arrays of a graph
+    """
+    nodes = list(G.nodes)
+    index = {v: i for i, v in enumerate(nodes)}
+
+    edges = list(G.edges(data='weight', default=1))
+    u = np.array([index[a] for a, _, _ in edges], dtype=np.int64)
+    v = np.array([index[b] for _, b, _ in edges], dtype=np.int64)
+    w = np.array([d for _, _, d in edges], dtype=float)
+
+    return nodes, u, v, w
+
+
+def kruskal_edge_indices(n, u, v, w):
+    """
+    Return indices of the minimum spanning forest edges using Kruskal's algorithm
+    """
+    order = np.argsort(w, kind='stable')
+    uf = UnionFind(n)
+    tree = []
+
+    # Scan edges by increasing weight until the forest is complete
+    for e, a, b in zip(order.tolist(), u[order].tolist(), v[order].tolist()):
+        if uf.union(a, b):
+            tree.append(e)
+            if uf.num_sets == 1: break
+
+    return np.array(tree, dtype=np.int64)
+
+
+def randomized_greedy_edge_indices(n, u, v, w, noise=0.5, seed=None):
+    """
+    Return indices of a spanning forest built greedily on randomly perturbed weights
+    """
+    rng = np.random.default_rng(seed)
+    return kruskal_edge_indices(n, u, v, w * rng.uniform(1, 1 + noise, size=len(w)))
+
+
+def kruskal_minimum_spanning_tree(G):
+    """
+    Kruskal's algorithm with union-find over sorted weight arrays
+    Return Tree graph
+    """
+    start_time = time.perf_counter()
+
+    nodes, u, v, w = get_edge_arrays(G)
+    tree = kruskal_edge_indices(len(nodes), u, v, w)
+
+    return _get_tree_graph(G, nodes, u[tree], v[tree], start_time)
+
+
+def boruvka_edge_indices(n, u, v, w, workers=None):
+    """
+    Return indices of the minimum spanning forest edges using Borůvka's algorithm
+    Every round finds the minimum outgoing edge of all components at once with a scatter-min reduction
+    """
+    # Unique edge ranks break weight ties, so the chosen edges never close a cycle
+    order = np.argsort(w, kind='stable')
+    rank = np.empty(len(w), dtype=np.int64)
+    rank[order] = np.arange(len(w))
+
+    comp = np.arange(n)
+    tree = []
+
+    # Split the edge scan across a process pool sharing the edge arrays
+    pool = None
+    if workers is not None and workers > 1 and len(w) > 0:
+        shared = [_to_shared_memory(a) for a in (u, v, rank, comp)]
+        comp = shared[3][1]
+        pool = ProcessPoolExecutor(max_workers=workers)
+        bounds = np.linspace(0, len(w), workers + 1).astype(int)
+        names = [shm.name for shm, _ in shared]
+
+    alive = np.arange(len(w))
+    try:
+        while True:
+            if pool is None:
+                # Drop edges inside a component for good
+                cu, cv = comp[u[alive]], comp[v[alive]]
+                keep = cu != cv
+                alive = alive[keep]
+                best_comp, best_rank = _min_outgoing_ranks(cu[keep], cv[keep], rank[alive], n)
+            else:
+                chunks = pool.map(_boruvka_chunk, [(names, n, len(w), lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:])])
+                best_comp, best_rank = _segment_min(*map(np.concatenate, zip(*chunks)), n)
+
+            if len(best_comp) == 0: break
+
+            # Each component hooks onto the other endpoint of its cheapest edge
+            chosen = order[best_rank]
+            tree.append(_unique_sorted(chosen))
+            other = np.where(comp[u[chosen]] == best_comp, comp[v[chosen]], comp[u[chosen]])
+
+            parent = np.arange(n)
+            parent[best_comp] = other
+
+            # Two components that chose the same edge point at each other, the smaller becomes the root
+            mutual = (parent[other] == best_comp) & (best_comp < other)
+            parent[best_comp[mutual]] = best_comp[mutual]
+
+            # Pointer jumping until every node points at its root
+            while True:
+                grand = parent[parent]
+                if np.array_equal(grand, parent): break
+                parent = grand
+
+            comp[:] = parent[comp]
+    finally:
+        if pool is not None:
+            pool.shutdown()
+            for shm, _ in shared:
+                shm.close()
+                shm.unlink()
+
+    return np.concatenate(tree) if tree else np.empty(0, dtype=np.int64)
+
+
+def boruvka_minimum_spanning_tree(G, workers=None):
+    """
+    Vectorized Borůvka's algorithm, optionally over a process pool
+    Return Tree graph
+    """
+    start_time = time.perf_counter()
+
+    nodes, u, v, w = get_edge_arrays(G)
+    tree = boruvka_edge_indices(len(nodes), u, v, w, workers)
+
+    return _get_tree_graph(G, nodes, u[tree], v[tree], start_time)
+
+
+def external_kruskal(path, out_path, n=None, chunk_size=10**6, block_size=10**4):
+    """
+    Kruskal's algorithm over a binary edge file in bounded memory
+    Edges are sorted in runs of chunk_size, the runs are merged lazily and tree edges are streamed to out_path
+    Return number of tree edges and tree weight
+    """
+    edges = read_edge_file(path)
+    if n is None:
+        n = get_num_nodes(edges, chunk_size)
+
+    uf = UnionFind(n)
+    num_edges, weight = 0, 0.0
+
+    with tempfile.TemporaryDirectory() as tmp_dir, open(out_path, 'wb') as out:
+        # Sort runs that fit in memory
+        runs = []
+        for chunk in iter_edge_blocks(edges, chunk_size):
+            runs.append(os.path.join(tmp_dir, f"run_{len(runs)}.bin"))
+            chunk[np.argsort(chunk['w'], kind='stable')].tofile(runs[-1])
+
+        # Merge the runs block by block and keep the edges joining two components
+        merged = heapq.merge(*(_iter_edge_file(run, block_size) for run in runs), key=lambda e: e[2])
+        buffer = []
+        for a, b, c in merged:
+            if not uf.union(a, b): continue
+
+            buffer.append((a, b, c))
+            num_edges += 1
+            weight += c
+
+            # Stream full buffers out
+            if len(buffer) >= block_size:
+                np.array(buffer, dtype=EDGE_DTYPE).tofile(out)
+                buffer.clear()
+
+            if uf.num_sets == 1: break
+
+        np.array(buffer, dtype=EDGE_DTYPE).tofile(out)
+
+    return num_edges, weight
+
+
+def prim_minimum_spanning_tree(G):
+    """
+    Heap-based Prim's algorithm, suited for dense graphs
+    Return Tree graph
+    """
+    start_time = time.perf_counter()
+
+    visited = set()
+    tree_edges = []
+
+    # Counter breaks weight ties so nodes are never compared
+    counter = itertools.count()
+
+    # Grow a tree from every node not reached yet
+    for root in G.nodes:
+        if root in visited: continue
+        visited.add(root)
+
+        heap = [(d.get('weight', 1), next(counter), root, j) for j, d in G.adj[root].items()]
+        heapq.heapify(heap)
+
+        while heap:
+            _, _, i, j = heapq.heappop(heap)
+            if j in visited: continue
+
+            visited.add(j)
+            tree_edges.append((i, j))
+
+            for k, d in G.adj[j].items():
+                if k not in visited:
+                    heapq.heappush(heap, (d.get('weight', 1), next(counter), j, k))
+
+    T = G.edge_subgraph(tree_edges).copy()
+    T.graph['runtime'] = time.perf_counter() - start_time
+
+    return T
+
+
+def find_subtours(n, u, v, x_vals):
+    """
+    Return interior edge indices and size of every component with a cycle in an integer solution
+    """
+    # One union-find pass over the selected edges
+    labels = _component_labels(n, u, v, x_vals > 0.5)
+
+    # Only a disconnected solution can contain a subtour
+    if labels.max() == 0: return []
+
+    sizes = np.bincount(labels)
+
+    return [(idx, sizes[c]) for c, idx in _group_interior_edges(labels, u, v) if len(idx) >= sizes[c]]
+
+
+def find_fractional_subtours(n, u, v, x_vals, tol=1e-6, thresholds=(0.5, 1 - 1e-6)):
+    """
+    Return interior edge indices and size of every node set violating a subtour constraint in a fractional solution
+    """
+    # Candidate sets are the components of the support and of its heavier edges
+    candidates = [_component_labels(n, u, v, x_vals > t) for t in (tol,) + tuple(thresholds)]
+    subtours = _violated_subtours(candidates, u, v, x_vals, tol)
+
+    # Otherwise a connected support may still have a global min cut below 1, one of its sides is then violated
+    if not subtours and candidates[0].max() == 0:
+        support = np.flatnonzero(x_vals > tol)
+        H = nx.Graph()
+        H.add_weighted_edges_from(zip(u[support].tolist(), v[support].tolist(), x_vals[support].tolist()))
+        cut_value, (S, _) = nx.stoer_wagner(H)
+        if cut_value < 1 - tol:
+            labels = np.zeros(n, dtype=np.int64)
+            labels[list(S)] = 1
+            subtours = _violated_subtours([labels], u, v, x_vals, tol)
+
+    return subtours
+
+
+def tree_weight(T):
+    """
+    Return total weight of a tree
+    """
+    return T.size(weight='weight')
+
+
+def check_minimum_spanning_tree(H, T, tol=1e-9):
+    """
+    Return True if both trees span the same nodes with the same total weight
+    """
+    return (
+        H.number_of_edges() == T.number_of_edges() and
+        abs(tree_weight(H) - tree_weight(T)) <= tol
+    )
+
+
+def _get_tree_graph(G, nodes, u, v, start_time):
+    """
+    Return the subgraph of G induced by the tree edges given as index arrays
+    """
+    T = G.edge_subgraph([(nodes[a], nodes[b]) for a, b in zip(u.tolist(), v.tolist())]).copy()
+    T.graph['runtime'] = time.perf_counter() - start_time
+
+    return T
+
+
+def _violated_subtours(candidates, u, v, x_vals, tol):
+    """
+    Return the distinct label groups whose interior weight exceeds |S| - 1
+    """
+    subtours = {}
+    for labels in candidates:
+        sizes = np.bincount(labels)
+        for c, idx in _group_interior_edges(labels, u, v):
+            if x_vals[idx].sum() > sizes[c] - 1 + tol:
+                subtours[idx.tobytes()] = (idx, sizes[c])
+
+    return list(subtours.values())
+
+
+def _component_labels(n, u, v, mask):
+    """
+    Return component label of every node in the subgraph of the masked edges
+    """
+    uf = UnionFind(n)
+    for a, b in zip(u[mask].tolist(), v[mask].tolist()):
+        uf.union(a, b)
+
+    # Relabel representatives as 0, 1, ...
+    _, labels = np.unique(np.array(uf.labels(), dtype=np.int64), return_inverse=True)
+
+    return labels
+
+
+def _group_interior_edges(labels, u, v):
+    """
+    Return the indices of the edges inside every node label group
+    """
+    lu = labels[u]
+    inside = np.flatnonzero(lu == labels[v])
+
+    # Sort interior edges by label and split at every label change
+    order = inside[np.argsort(lu[inside], kind='stable')]
+    groups = lu[order]
+    starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]]) if len(order) else []
+
+    return [(groups[i], idx) for i, idx in zip(starts, np.split(order, starts[1:]))]
+
+
+def _min_outgoing_ranks(cu, cv, ranks, n):
+    """
+    Return every component with an outgoing edge and the smallest rank among its outgoing edges
+    """
+    return _segment_min(np.concatenate([cu, cv]), np.concatenate([ranks, ranks]), n)
+
+
+def _segment_min(keys, vals, n):
+    """
+    Return the distinct keys in range(n) and the smallest value of every key
+    """
+    # Unbuffered scatter-min, a sort by key followed by reduceat costs an order of magnitude more
+    best = np.full(n, np.iinfo(np.int64).max)
+    np.minimum.at(best, keys, vals)
+    found = np.flatnonzero(best != np.iinfo(np.int64).max)
+
+    return found, best[found]
+
+
+def _boruvka_chunk(args):
+    """
+    Return partial minimum outgoing ranks of one slice of the shared edge arrays
+    """
+    names, n, m, lo, hi = args
+    shms = [shared_memory.SharedMemory(name=name) for name in names]
+    try:
+        u, v, rank = (np.ndarray((m,), dtype=np.int64, buffer=shm.buf) for shm in shms[:3])
+        comp = np.ndarray((n,), dtype=np.int64, buffer=shms[3].buf)
+
+        cu, cv = comp[u[lo:hi]], comp[v[lo:hi]]
+        keep = cu != cv
+        result = _min_outgoing_ranks(cu[keep], cv[keep], rank[lo:hi][keep], n)
+
+        # Copy out of the shared buffers before closing them
+        return result[0].copy(), result[1].copy()
+    finally:
+        for shm in shms:
+            shm.close()
+
+
+def _to_shared_memory(a):
+    """
+    Return shared memory block and an int64 array view holding a copy of a
+    """
+    a = np.asarray(a, dtype=np.int64)
+    shm = shared_memory.SharedMemory(create=True, size=max(a.nbytes, 1))
+    view = np.ndarray(a.shape, dtype=np.int64, buffer=shm.buf)
+    view[:] = a
+
+    return shm, view
+
+
+def _unique_sorted(a):
+    """
+    Return the sorted distinct values of a
+    """
+    a = np.sort(a)
+    return a[np.r_[True, a[1:] != a[:-1]]] if len(a) else a
+
+
+def _iter_edge_file(path, block_size):
+    """
+    Yield (u, v, w) tuples of a binary edge file reading one block at a time
+    """
+    for block in iter_edge_blocks(read_edge_file(path), block_size):
+        yield from zip(block['u'].tolist(), block['v'].tolist(), block['w'].tolist())
\ No newline at end of file
@@ -0,0 +1,62 @@
+import numpy as np
+import json
+import csv
+import os
+
+
+# Binary edge record: endpoints and weight as fixed-width little-endian columns
+EDGE_DTYPE = np.dtype([('u', '<i8'), ('v', '<i8'), ('w', '<f8')])
+
+
+def write_edge_file(path, u, v, w):
+    """
+    Write edge arrays to a binary edge file
+    """
+    edges = np.empty(len(u), dtype=EDGE_DTYPE)
+    edges['u'], edges['v'], edges['w'] = u, v, w
+    edges.tofile(path)
+
+
+def read_edge_file(path):
+    """
+    Return a read-only memory map over a binary edge file
+    """
+    # Empty files cannot be mapped
+    if os.path.getsize(path) == 0: return np.empty(0, dtype=EDGE_DTYPE)
+
+    return np.memmap(path, dtype=EDGE_DTYPE, mode='r')
+
+
+def iter_edge_blocks(edges, block_size):
+    """
+    Yield consecutive in-memory blocks of a memory-mapped edge array
+    """
+    for lo in range(0, len(edges), block_size):
+        yield np.array(edges[lo:lo + block_size])
+
+
+def get_num_nodes(edges, block_size=10**6):
+    """
+    Return one plus the largest node index of an edge array
+    """
+    n = 0
+    for block in iter_edge_blocks(edges, block_size):
+        n = max(n, int(block['u'].max()) + 1, int(block['v'].max()) + 1)
+
+    return n
+
+
+def write_results(results, path):
+    """
+    Write benchmark result rows to a CSV or JSON file, chosen by the file extension
+    """
+    if path.endswith('.json'):
+        with open(path, 'w') as f:
+            json.dump(results, f, indent=2)
+        return
+
+    keys = list(dict.fromkeys(k for row in results for k in row))
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=keys)
+        writer.writeheader()
+        writer.writerows(results)
\ No newline at end of file
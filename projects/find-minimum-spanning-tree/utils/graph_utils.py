@@ -1,67 +1,168 @@
+from utils.file_utils import *
 import networkx as nx
 import matplotlib.pyplot as plt
-import random
+from matplotlib.figure import Figure
+from scipy.sparse.csgraph import shortest_path
+import numpy as np
 
 
-def network_generator(n, m):
+def network_generator(n, m, seed=None, path=None):
     """
     Return random graph
+    With a path, write it as a binary edge file instead and return the path
     """
-    # create complete graph
-    G = nx.complete_graph(n)
-    
-    edges = list(G.edges())
-    random.shuffle(edges)
-    
-    # removes valid edges
-    while G.number_of_edges() > m:
-        u, v = edges.pop()
-        G.remove_edge(u, v)
-
-        # make sure edge is valid
-        if not nx.is_connected(G) or any(d == 1 for _, d in G.degree()):
-            G.add_edge(u, v)
-
-    # Add weights attributes
-    weights = {e: random.randint(1, 10) for e in G.edges()}
-    nx.set_edge_attributes(G, weights, 'weight')
+    u, v, w = random_edge_arrays(n, m, seed)
+
+    # Skip the graph object entirely for out-of-core pipelines
+    if path is not None:
+        write_edge_file(path, u, v, w)
+        return path
+
+    # Build graph from edge arrays
+    G = nx.Graph()
+    G.add_nodes_from(range(n))
+    G.add_weighted_edges_from(zip(u.tolist(), v.tolist(), w.tolist()))
 
     return G
 
 
-def show_graphs(graphs, plot_flag=True):
+def random_edge_arrays(n, m, seed=None):
     """
-    Plot graphs in a list of graphs
+    Return endpoint and weight arrays of a random connected graph with minimum degree 2
     """
-    if not plot_flag: return
+    if n < 3 or m < n or m > n * (n - 1) // 2:
+        raise ValueError("wrong number of edges.")
 
-    # Number of graphs
-    num_graphs = len(graphs)
+    rng = np.random.default_rng(seed)
 
-    # Create subplots
-    _, axes = plt.subplots(1, num_graphs, figsize=(5 * num_graphs, 5))
+    # Random Hamiltonian cycle keeps the graph connected with minimum degree 2
+    perm = rng.permutation(n)
+    keys = _edge_keys(perm, np.roll(perm, -1), n)
 
-    # If there's only one graph, axes will not be an array, so we wrap it in a list
-    if num_graphs == 1:
-        axes = [axes]
+    # Add the remaining edges among the missing pairs
+    keys = np.concatenate([keys, _random_extra_keys(n, m - n, keys, rng)])
 
-    # Iterate over the graphs and draw them
-    for i, G in enumerate(graphs):
-        edge_labels = nx.get_edge_attributes(G, 'weight')
+    # Add weights
+    w = rng.integers(1, 11, size=m)
+
+    return keys // n, keys % n, w
+
+
+def _edge_keys(u, v, n):
+    """
+    Return unique integer key of every undirected edge
+    """
+    return np.minimum(u, v).astype(np.int64) * n + np.maximum(u, v)
+
+
+def _random_extra_keys(n, k, keys, rng):
+    """
+    Return k distinct random edge keys not in keys
+    """
+    if k == 0: return np.empty(0, dtype=np.int64)
 
-        # Get position for every graph
-        pos = nx.spring_layout(G)
+    # Dense graphs: sample directly among all missing pairs
+    if 2 * (len(keys) + k) > n * (n - 1) // 2:
+        i, j = np.triu_indices(n, 1)
+        free = i * n + j
+        return rng.choice(free[~np.isin(free, keys)], k, replace=False)
 
-        # Draw graph
-        nx.draw(G, pos, with_labels=True, node_color='lightblue', edge_color='gray', node_size=500, width=2, ax=axes[i])
+    # Sparse graphs: draw random pairs until there are enough new ones
+    extra = np.empty(0, dtype=np.int64)
+    while len(extra) < k:
+        size = 2 * (k - len(extra)) + 16
+        a, b = rng.integers(0, n, size), rng.integers(0, n, size)
+        extra = np.sort(np.concatenate([extra, _edge_keys(a[a != b], b[a != b], n)]))
 
-        # Draw labels
-        nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels, ax=axes[i])
+        # Drop duplicates and existing edges with a sort-based pass
+        extra = extra[np.r_[True, extra[1:] != extra[:-1]]]
+        extra = extra[~np.isin(extra, keys)]
+
+    return rng.choice(extra, k, replace=False)
+
+
+def get_layout(graphs, layout_limit=1000, seed=0):
+    """
+    Return one node layout shared by all graphs
+    Spring layout up to layout_limit nodes, pivot MDS layout in O(num_pivots * m) above it
+    """
+    U = nx.compose_all(graphs)
 
-    axes[0].set_title(f"Graph")
-    axes[1].set_title(f"Minimum Spanning Tree")
-    axes[2].set_title(f"NX Minimum Spanning Tree")
+    if U.number_of_nodes() <= layout_limit:
+        return nx.spring_layout(U, seed=seed)
 
-    # Show figure
-    plt.tight_layout()
-    plt.show()
\ No newline at end of file
+    return _pivot_mds_layout(U, seed=seed)
+
+
+def _pivot_mds_layout(G, num_pivots=50, seed=None):
+    """
+    Return layout from classical scaling of the hop distances to max-min spaced pivot nodes
+    """
+    nodes = list(G.nodes)
+    A = nx.to_scipy_sparse_array(G, nodelist=nodes, weight=None, format='csr')
+    rng = np.random.default_rng(seed)
+
+    # Every next pivot is the node farthest from the pivots chosen so far
+    pivots = [int(rng.integers(len(nodes)))]
+    D = np.empty((len(nodes), min(num_pivots, len(nodes))))
+    for k in range(D.shape[1]):
+        D[:, k] = shortest_path(A, unweighted=True, indices=pivots[-1])
+        finite = np.isfinite(D[:, k])
+        D[~finite, k] = D[finite, k].max() + 1
+        pivots.append(int(np.argmax(D[:, :k + 1].min(axis=1))))
+
+    # Double centering of the squared distances, coordinates from the two leading singular vectors
+    C = D ** 2
+    C = -0.5 * (C - C.mean(axis=0) - C.mean(axis=1, keepdims=True) + C.mean())
+    U, S, _ = np.linalg.svd(C, full_matrices=False)
+    pos = nx.rescale_layout(U[:, :2] * S[:2])
+
+    return dict(zip(nodes, pos))
+
+
+def show_graphs(graphs, plot_flag=True, titles=None, path=None, pos=None, layout_limit=1000):
+    """
+    Plot graphs in a list of graphs with a shared layout
+    Graphs above layout_limit nodes are drawn without labels as thin translucent edges
+    With a path the figure is written to a PNG/SVG file through a headless canvas instead of shown
+    """
+    if not plot_flag: return
+
+    # Number of graphs
+    num_graphs = len(graphs)
+    titles = titles or [f"Graph {i + 1}" for i in range(num_graphs)]
+
+    # Create subplots, a standalone figure does not need a display
+    if path is None:
+        fig, axes = plt.subplots(1, num_graphs, figsize=(5 * num_graphs, 5), squeeze=False)
+    else:
+        fig = Figure(figsize=(5 * num_graphs, 5))
+        axes = fig.subplots(1, num_graphs, squeeze=False)
+
+    # Compute the layout once for all graphs
+    if pos is None:
+        pos = get_layout(graphs, layout_limit)
+    large = len(pos) > layout_limit
+
+    # Iterate over the graphs and draw them
+    for ax, G, title in zip(axes[0], graphs, titles):
+        if large:
+            nx.draw_networkx_edges(G, pos, edge_color='gray', width=0.2, alpha=0.3, ax=ax)
+            nx.draw_networkx_nodes(G, pos, node_color='lightblue', node_size=1, ax=ax)
+            ax.set_axis_off()
+        else:
+            # Draw graph
+            nx.draw(G, pos, with_labels=True, node_color='lightblue', edge_color='gray', node_size=500, width=2, ax=ax)
+
+            # Draw labels
+            nx.draw_networkx_edge_labels(G, pos, edge_labels=nx.get_edge_attributes(G, 'weight'), ax=ax)
+
+        ax.set_title(title)
+
+    fig.tight_layout()
+
+    # Show or save figure
+    if path is None:
+        plt.show()
+    else:
+        fig.savefig(path)
\ No newline at end of file
@@ -1,64 +1,242 @@
-from utils.calculation_utils import *
+from utils.engine_utils import *
 import networkx as nx
+import numpy as np
+import scipy.sparse as sp
 import gurobipy as gp
 from gurobipy import GRB
+import time
 
 
-def solve_minimum_spanning_tree(G):
+def build_minimum_spanning_tree_model(G, formulation='subtour'):
     """
-    MIP formulation for solving minimum spanning tree
-    Return Tree graph
+    Return MIP model and edge variables for the minimum spanning tree
+    The 'subtour' formulation leaves subtour elimination to the lazy callback, so setup is linear in the graph size
+    The compact 'scf', 'mcf' and 'martin' formulations are built in one sparse matrix pass
     """
-    # Set Parameters
-    S = [{
-            'edges': [e for e in G.edges if e[0] in s and e[1] in s],
-            'n': len(s)
-         }
-         for s in get_subsets(G.nodes) if len(s) > 1
-    ]
-    
+    nodes, u, v, w = get_edge_arrays(G)
+    n, m = len(nodes), len(w)
+
     # Create model problem model
     model = gp.Model("Minimum_Spanning_Tree")
 
     # Suppress output
     model.setParam("OutputFlag", 0)
 
-    # Enable lazy constraints
-    model.setParam(GRB.Param.LazyConstraints, 1)
-
     # Add decision variables
-    x = model.addVars(G.edges, vtype=GRB.BINARY, name="x")
-    # x = model.addVars(G.edges, vtype=GRB.CONTINUOUS, name="x")
+    x = model.addMVar(m, vtype=GRB.BINARY, name="x")
 
     # Set objective function
-    model.setObjective(gp.quicksum(G.edges[e]['weight'] * x[e] for e in G.edges), GRB.MINIMIZE)
+    model.setObjective(w @ x, GRB.MINIMIZE)
 
     # Add constraints
-    model.addConstr(gp.quicksum(x[e] for e in G.edges) == len(G.nodes) - 1, name="c1")
-    
-    def lazy_callback(model, where):
-        if where != GRB.Callback.MIPSOL: return
+    model.addConstr(x.sum() == n - 1, name="c1")
+    FORMULATIONS[formulation](model, x, n, u, v)
+
+    return model, x
+
+
+def _add_subtour_constraints(model, x, n, u, v):
+    """
+    Enable lazy constraints, subtours are separated in the callback
+    """
+    model.setParam(GRB.Param.LazyConstraints, 1)
+
+
+def _add_single_commodity_flow_constraints(model, x, n, u, v):
+    """
+    Root sends one unit of flow to every other node along the arcs of selected edges
+    """
+    N, E = _get_arc_matrices(n, u, v)
+    b = np.ones(n)
+    b[0] = -(n - 1)
+
+    f = model.addMVar(N.shape[1], lb=0, name="f")
+    model.addConstr(N @ f == b, name="c2")
+    model.addConstr(f - (n - 1) * (E @ x) <= 0, name="c3")
+
+
+def _add_multi_commodity_flow_constraints(model, x, n, u, v):
+    """
+    Root sends a separate commodity to every other node through oriented arcs of selected edges
+    """
+    N, E = _get_arc_matrices(n, u, v)
+    num_arcs = N.shape[1]
+    K = n - 1
+
+    # Commodity k goes from the root to node k + 1
+    b = np.zeros((K, n))
+    b[:, 0] = -1
+    b[np.arange(K), np.arange(1, n)] = 1
+
+    y = model.addMVar(num_arcs, lb=0, name="y")
+    f = model.addMVar(K * num_arcs, lb=0, name="f")
+    model.addConstr(x - E.T @ y == 0, name="c2")
+    model.addConstr(sp.kron(sp.eye(K), N, format='csr') @ f == b.ravel(), name="c3")
+    model.addConstr(f - sp.kron(np.ones((K, 1)), sp.eye(num_arcs), format='csr') @ y <= 0, name="c4")
+
+
+def _add_martin_constraints(model, x, n, u, v):
+    """
+    Martin's formulation: for every node k, each edge is oriented towards k and every other node has one arc towards k
+    """
+    N, E = _get_arc_matrices(n, u, v)
+    num_arcs = N.shape[1]
+
+    # Out-degree of every node
+    Out = (N < 0).astype(float)
+
+    z = model.addMVar(n * num_arcs, lb=0, name="z")
+    model.addConstr(
+        sp.kron(sp.eye(n), E.T, format='csr') @ z - sp.kron(np.ones((n, 1)), sp.eye(len(u)), format='csr') @ x == 0,
+        name="c2"
+    )
+    model.addConstr(sp.kron(sp.eye(n), Out, format='csr') @ z == 1 - np.eye(n).ravel(), name="c3")
+
+
+def _get_arc_matrices(n, u, v):
+    """
+    Return node-arc incidence matrix (inflow minus outflow) and arc-edge matrix of both orientations of every edge
+    """
+    m = len(u)
+    arcs = np.arange(2 * m)
+    tail, head = np.r_[u, v], np.r_[v, u]
 
-        # Get the current solution
-        x_vals = model.cbGetSolution(x)
+    N = sp.csr_matrix(
+        (np.r_[np.ones(2 * m), -np.ones(2 * m)], (np.r_[head, tail], np.r_[arcs, arcs])),
+        shape=(n, 2 * m)
+    )
+    E = sp.csr_matrix((np.ones(2 * m), (arcs, np.r_[np.arange(m), np.arange(m)])), shape=(2 * m, m))
 
-        # Build subgraph from selected edges
-        selected_edges = [e for e in G.edges if x_vals[e] > 0.5]
-        subgraph = G.edge_subgraph(selected_edges).copy()
-        subgraph.add_nodes_from(G.nodes)
+    return N, E
 
-        # Only add lazy constraints if the subgraph is disconnected
-        if nx.number_connected_components(subgraph) <= 1: return
 
-        # Add a lazy constraint for each connected component
-        for component in nx.connected_components(subgraph):
-            interior_edges = list(nx.edge_boundary(G, component, component))
-            if len(interior_edges) < len(component): continue
+def solve_minimum_spanning_tree(G, formulation='subtour', fractional_cuts=False, start=None, seed=None):
+    """
+    MIP formulation for solving minimum spanning tree
+    Subtour constraints are separated on edge index arrays, optionally also on the node relaxations
+    A 'kruskal' or randomized 'greedy' tree can be loaded as MIP start
+    Return Tree graph
+    """
+    start_time = time.perf_counter()
+
+    # Create model
+    model, x = build_minimum_spanning_tree_model(G, formulation)
+    nodes, u, v, w = get_edge_arrays(G)
+    x_vars = x.tolist()
+    separate = formulation == 'subtour'
 
-            model.cbLazy(gp.quicksum(x[e] for e in interior_edges) <= len(component) - 1)
+    # Load a feasible tree as MIP start
+    if start is not None:
+        tree = MIP_STARTS[start](len(nodes), u, v, w, seed=seed)
+        start_vals = np.zeros(len(x_vars))
+        start_vals[tree] = 1
+        model.setAttr("Start", x_vars, start_vals.tolist())
+
+    # Allow user cuts on the node relaxations
+    if separate and fractional_cuts:
+        model.setParam(GRB.Param.PreCrush, 1)
+
+    setup_time = time.perf_counter() - start_time
+    stats = {'callback_time': 0.0, 'num_lazy_cuts': 0, 'num_fractional_cuts': 0, 'first_incumbent_time': None}
+
+    def subtour_constraint(idx, size):
+        return gp.LinExpr([1.0] * len(idx), [x_vars[e] for e in idx.tolist()]) <= size - 1
+
+    def lazy_callback(model, where):
+        callback_start = time.perf_counter()
+
+        # Integer solutions: add a lazy constraint for each component with a cycle
+        if where == GRB.Callback.MIPSOL:
+            x_vals = np.array(model.cbGetSolution(x_vars))
+            subtours = find_subtours(len(nodes), u, v, x_vals) if separate else []
+            for idx, size in subtours:
+                model.cbLazy(subtour_constraint(idx, size))
+            stats['num_lazy_cuts'] += len(subtours)
+
+            # A solution without subtours becomes the incumbent
+            if not subtours and stats['first_incumbent_time'] is None:
+                stats['first_incumbent_time'] = model.cbGet(GRB.Callback.RUNTIME)
+
+        # Node relaxations: tighten the bound with min cut separation before branching
+        elif (where == GRB.Callback.MIPNODE and separate and fractional_cuts and
+              model.cbGet(GRB.Callback.MIPNODE_STATUS) == GRB.OPTIMAL):
+            x_vals = np.array(model.cbGetNodeRel(x_vars))
+            subtours = find_fractional_subtours(len(nodes), u, v, x_vals)
+            for idx, size in subtours:
+                model.cbCut(subtour_constraint(idx, size))
+            stats['num_fractional_cuts'] += len(subtours)
+
+        stats['callback_time'] += time.perf_counter() - callback_start
 
     # Solve
     model.optimize(lazy_callback)
 
-    if model.Status == 3: return nx.Graph()
-    return G.edge_subgraph([e for e in G.edges if x[e].X > 0.5])
\ No newline at end of file
+    if model.Status == GRB.INFEASIBLE: return nx.Graph()
+
+    # Copy the tree so the statistics do not leak into the attributes of G
+    T = G.edge_subgraph([e for e, val in zip(G.edges, x.X) if val > 0.5]).copy()
+    T.graph['setup_time'] = setup_time
+    T.graph['runtime'] = time.perf_counter() - start_time
+    T.graph['optimal_time'] = model.Runtime
+    T.graph.update(stats)
+
+    return T
+
+
+def get_lp_bound(G, formulation='subtour'):
+    """
+    Return the LP relaxation bound of a formulation and its solve time
+    The 'subtour' relaxation is tightened with fractional subtour cuts until none is violated
+    """
+    model, x = build_minimum_spanning_tree_model(G, formulation)
+    model.update()
+    relaxed = model.relax()
+    relaxed.optimize()
+    runtime = relaxed.Runtime
+
+    if formulation == 'subtour':
+        nodes, u, v, _ = get_edge_arrays(G)
+        x_vars = [relaxed.getVarByName(var.VarName) for var in x.tolist()]
+
+        # Cutting plane loop: relax, solve, add the violated subtour constraints
+        while True:
+            subtours = find_fractional_subtours(len(nodes), u, v, np.array(relaxed.getAttr('X', x_vars)))
+            if not subtours: break
+            for idx, size in subtours:
+                relaxed.addConstr(gp.LinExpr([1.0] * len(idx), [x_vars[e] for e in idx.tolist()]) <= size - 1)
+            relaxed.optimize()
+            runtime += relaxed.Runtime
+
+    return relaxed.ObjVal, runtime
+
+
+def _kruskal_start(n, u, v, w, seed=None):
+    """
+    Return indices of the Kruskal tree, seed is unused
+    """
+    return kruskal_edge_indices(n, u, v, w)
+
+
+# Available MIP formulations
+FORMULATIONS = {
+    'subtour': _add_subtour_constraints,
+    'scf': _add_single_commodity_flow_constraints,
+    'mcf': _add_multi_commodity_flow_constraints,
+    'martin': _add_martin_constraints
+}
+
+
+# Available MIP start trees
+MIP_STARTS = {
+    'kruskal': _kruskal_start,
+    'greedy': randomized_greedy_edge_indices
+}
+
+
+# Available minimum spanning tree engines
+MST_ENGINES = {
+    'mip': solve_minimum_spanning_tree,
+    'kruskal': kruskal_minimum_spanning_tree,
+    'prim': prim_minimum_spanning_tree,
+    'boruvka': boruvka_minimum_spanning_tree
+}
\ No newline at end of file